@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for the web dashboard render path."""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List
+
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+import study_dashboard
+import study_dashboard_web as web
+
+
+def _measure(func: Callable[[], object], repeat: int, setup: Callable[[], object] | None = None) -> List[float]:
+    """Time ``func`` ``repeat`` times; ``setup`` runs before each call, outside the timing."""
+    timings: List[float] = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def _report(label: str, timings: List[float]) -> None:
+    print(f"{label:<32} p50 {statistics.median(timings):8.2f} ms   min {min(timings):8.2f} ms")
+
+
+def bench_template_render(repeat: int = 30) -> None:
+    """Compare a cold `/` (template parsed and compiled) with a warm one.
+
+    The rendered-page cache is cleared before every timed request so both
+    lines measure a real render; the cache-hit latency is reported apart.
+    """
+    client = web.app.test_client()
+    precompiled = web.DASHBOARD_TEMPLATE
+
+    def cold() -> None:
+        web.DASHBOARD_TEMPLATE = web.app.jinja_env.from_string(web.HTML_TEMPLATE)
+        client.get("/")
+
+    def warm() -> None:
+        client.get("/")
+
+    try:
+        _report("GET / cold template", _measure(cold, repeat, setup=web._page_cache.clear))
+    finally:
+        web.DASHBOARD_TEMPLATE = precompiled
+    _report("GET / warm template", _measure(warm, repeat, setup=web._page_cache.clear))
+    client.get("/")
+    _report("GET / page cache hit", _measure(warm, repeat))
+
+
+def _synthetic_schedule(count: int) -> List[Dict[str, str]]:
+    """Repeat the real schedule week by week until it holds ``count`` entries."""
+    base = web.scientific_methods_schedule + web.accounting_theory_schedule
+    entries: List[Dict[str, str]] = []
+    week = 0
+    while len(entries) < count:
+        for entry in base:
+            shifted = date.fromisoformat(entry["date"]) + timedelta(weeks=week)
+            entries.append({**entry, "date": shifted.isoformat(), "title": f"{entry['title']} #{week}"})
+        week += 1
+    return entries[:count]
+
+
+def bench_schedule_scaling(sizes: tuple[int, ...] = (25, 250, 2500, 10000), repeat: int = 15) -> None:
+    """Show how the schedule view model and an uncached GET / scale with the event count."""
+    client = web.app.test_client()
+    original = web.scientific_methods_schedule
+    now = datetime.now(web.TIMEZONE)
+    try:
+        for size in sizes:
+            web.scientific_methods_schedule = _synthetic_schedule(size)
+            schedule = web.get_course_schedule()
+
+            def view_model() -> None:
+                web.build_schedule_view_model(schedule, now, mini_year=now.year, mini_month=now.month)
+
+            _report(f"view model ({len(schedule)} events)", _measure(view_model, repeat))
+            _report(
+                f"GET / ({len(schedule)} events)",
+                _measure(lambda: client.get("/"), repeat, setup=web._page_cache.clear),
+            )
+            _report(f"GET / cache hit ({len(schedule)} events)", _measure(lambda: client.get("/"), repeat))
+    finally:
+        web.scientific_methods_schedule = original
+
+
+def _synthetic_tasks(count: int) -> List[Dict[str, str]]:
+    rng = random.Random(14)
+    start = date(2024, 8, 26)
+    return [
+        {
+            "title": f"Task {index}",
+            "course": f"Course {index % 12}",
+            "type": "assignment",
+            "due_date": (start + timedelta(days=rng.randrange(600))).isoformat(),
+            "due_time": rng.choice(["", "08:15", "12:00", "17:00", "23:59"]),
+        }
+        for index in range(count)
+    ]
+
+
+def bench_date_parsing(count: int = 100_000, repeat: int = 5) -> None:
+    """Compare strptime with the shared ISO fast path, then JSON with the binary cache."""
+    raw_tasks = _synthetic_tasks(count)
+
+    def with_strptime() -> None:
+        for raw in raw_tasks:
+            datetime.strptime(raw["due_date"], "%Y-%m-%d").date()
+            if raw["due_time"]:
+                datetime.strptime(raw["due_time"], "%H:%M").time()
+
+    def with_fast_path() -> None:
+        study_dashboard.parse_iso_date.cache_clear()
+        study_dashboard.parse_hhmm.cache_clear()
+        for raw in raw_tasks:
+            study_dashboard.parse_iso_date(raw["due_date"])
+            if raw["due_time"]:
+                study_dashboard.parse_hhmm(raw["due_time"])
+
+    _report(f"strptime ({count} tasks)", _measure(with_strptime, repeat))
+    _report(f"fast path ({count} tasks)", _measure(with_fast_path, repeat))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tasks_path = Path(tmp_dir) / "tasks.json"
+        tasks_path.write_text(json.dumps(raw_tasks), encoding="utf-8")
+        _report(
+            f"load_tasks JSON ({count} tasks)",
+            _measure(lambda: study_dashboard.load_tasks(tasks_path, use_cache=False), repeat),
+        )
+        _report(
+            f"write cache ({count} tasks)",
+            _measure(
+                lambda: study_dashboard.refresh_task_cache(tasks_path),
+                repeat,
+                setup=lambda: study_dashboard.task_cache_path(tasks_path).unlink(missing_ok=True),
+            ),
+        )
+        _report(
+            f"load_tasks cache ({count} tasks)",
+            _measure(lambda: study_dashboard.load_tasks(tasks_path), repeat),
+        )
+
+
+def bench_task_grouping(count: int = 100_000, repeat: int = 5) -> None:
+    """Sort and bucket ``count`` tasks with the bisect and NumPy paths."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tasks_path = Path(tmp_dir) / "tasks.json"
+        tasks_path.write_text(json.dumps(_synthetic_tasks(count)), encoding="utf-8")
+        tasks = study_dashboard.load_tasks(tasks_path, use_cache=False)
+    today = date(2025, 3, 12)
+
+    def with_bisect() -> None:
+        ordered = sorted(tasks, key=lambda t: t["due_datetime"])
+        study_dashboard.group_sorted_tasks(ordered, today)
+
+    _report(f"sort + bisect ({count} tasks)", _measure(with_bisect, repeat))
+    if study_dashboard.np is None:
+        print("numpy not installed; skipping vectorized grouping")
+        return
+    _report(
+        f"numpy argsort ({count} tasks)",
+        _measure(lambda: study_dashboard.group_tasks_vectorized(tasks, today), repeat),
+    )
+
+
+if __name__ == "__main__":
+    bench_template_render()
+    bench_schedule_scaling()
+    bench_date_parsing()
+    bench_task_grouping()
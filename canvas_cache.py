@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""Opt-in on-disk cache for Canvas GET responses."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict
+
+DEFAULT_CACHE_DIR = Path.home() / ".canvas_cache"
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+# Seconds a cached response is served without asking Canvas again.
+DEFAULT_TTLS = {
+    "courses": 3600.0,
+    "assignments": 300.0,
+    "files": 900.0,
+    "default": 300.0,
+}
+CACHED_HEADERS = ("Link", "ETag", "Last-Modified", "Content-Type")
+_ENDPOINT_RE = re.compile(r"/courses(?:/\d+/(assignments|files))?/?$")
+_INDEX_VERSION = 1
+
+
+def endpoint_type(url: str) -> str:
+    """Classify a Canvas API URL as courses, assignments, files or default."""
+    path = url.split("?", 1)[0]
+    match = _ENDPOINT_RE.search(path)
+    if match is None:
+        return "default"
+    return match.group(1) or "courses"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    status: int
+    body: bytes
+    headers: Dict[str, str]
+    fresh: bool
+
+    def validators(self) -> Dict[str, str]:
+        headers = {}
+        if self.headers.get("ETag"):
+            headers["If-None-Match"] = self.headers["ETag"]
+        if self.headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = self.headers["Last-Modified"]
+        return headers
+
+
+class ResponseCache:
+    """Content-addressed response store with per-endpoint TTLs and LRU eviction.
+
+    ``index.json`` maps a hash of (token, URL) to the response headers, the
+    time it was stored and last used, and the SHA-256 of its body; bodies live
+    once under ``objects/`` however many URLs share them. When the bodies
+    exceed ``max_bytes`` the least recently used entries are dropped. Entries
+    are kept in LRU order alongside a running byte total and per-body
+    reference counts, so storing a response never rescans the index. In
+    ``offline`` mode entries are served regardless of age and misses fail.
+    """
+
+    def __init__(
+        self,
+        directory: Path = DEFAULT_CACHE_DIR,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttls: Dict[str, float] | None = None,
+        offline: bool = False,
+    ) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.offline = offline
+        self._objects = directory / "objects"
+        self._index_path = directory / "index.json"
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, Dict[str, object]] = self._load_index()
+        self._references: Dict[str, int] = {}
+        self._total_bytes = 0
+        for entry in self._entries.values():
+            self._retain(entry)
+        self._stats = {"hits": 0, "revalidated": 0, "misses": 0, "evictions": 0}
+
+    def _load_index(self) -> OrderedDict[str, Dict[str, object]]:
+        try:
+            data = json.loads(self._index_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return OrderedDict()
+        if not isinstance(data, dict) or data.get("version") != _INDEX_VERSION:
+            return OrderedDict()
+        entries = data.get("entries")
+        if not isinstance(entries, dict):
+            return OrderedDict()
+        return OrderedDict(sorted(entries.items(), key=lambda item: float(item[1]["used_at"])))
+
+    def _retain(self, entry: Dict[str, object]) -> None:
+        digest = str(entry["body"])
+        count = self._references.get(digest, 0)
+        if count == 0:
+            self._total_bytes += int(entry["size"])
+        self._references[digest] = count + 1
+
+    def _release(self, entry: Dict[str, object]) -> None:
+        digest = str(entry["body"])
+        count = self._references[digest] - 1
+        if count:
+            self._references[digest] = count
+            return
+        del self._references[digest]
+        self._total_bytes -= int(entry["size"])
+        try:
+            (self._objects / digest).unlink()
+        except OSError:
+            pass
+
+    @staticmethod
+    def _key(url: str, request_headers: Dict[str, str]) -> str:
+        # Different tokens may see different data, so they never share entries.
+        token = request_headers.get("Authorization", "")
+        return hashlib.sha256(f"{token}\n{url}".encode("utf-8")).hexdigest()
+
+    def lookup(self, url: str, request_headers: Dict[str, str]) -> CachedResponse | None:
+        key = self._key(url, request_headers)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            try:
+                body = (self._objects / str(entry["body"])).read_bytes()
+            except OSError:
+                self._release(self._entries.pop(key))
+                self._stats["misses"] += 1
+                return None
+            now = time.time()
+            fresh = self.offline or now - float(entry["stored_at"]) < self.ttls.get(
+                endpoint_type(url), self.ttls["default"]
+            )
+            entry["used_at"] = now
+            self._entries.move_to_end(key)
+            if fresh:
+                self._stats["hits"] += 1
+        return CachedResponse(int(entry.get("status", 200)), body, dict(entry["headers"]), fresh)
+
+    def revalidated(self, url: str, request_headers: Dict[str, str]) -> None:
+        """Mark an entry fresh again after Canvas answered 304 to its validators."""
+        key = self._key(url, request_headers)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry["stored_at"] = entry["used_at"] = time.time()
+                self._entries.move_to_end(key)
+                self._stats["revalidated"] += 1
+
+    def store(
+        self,
+        url: str,
+        request_headers: Dict[str, str],
+        body: bytes,
+        response_headers: Dict[str, str],
+        status: int = 200,
+    ) -> None:
+        """Remember a response; non-200 statuses let offline runs replay expected errors too."""
+        digest = hashlib.sha256(body).hexdigest()
+        object_path = self._objects / digest
+        try:
+            if not object_path.exists():
+                self._objects.mkdir(parents=True, exist_ok=True)
+                tmp_path = object_path.with_name(f"{digest}.{os.getpid()}.{threading.get_ident()}.tmp")
+                tmp_path.write_bytes(body)
+                os.replace(tmp_path, object_path)
+        except OSError:
+            return
+        now = time.time()
+        key = self._key(url, request_headers)
+        entry = {
+            "url": url,
+            "status": status,
+            "body": digest,
+            "size": len(body),
+            "headers": {name: response_headers[name] for name in CACHED_HEADERS if name in response_headers},
+            "stored_at": now,
+            "used_at": now,
+        }
+        with self._lock:
+            # Retain the new body first so replacing an entry with the same
+            # body never drops its object file.
+            self._retain(entry)
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._release(previous)
+            self._entries[key] = entry
+            self._evict()
+
+    def _evict(self) -> None:
+        while self._total_bytes > self.max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._release(entry)
+            self._stats["evictions"] += 1
+
+    def save(self) -> None:
+        """Write the index and delete bodies no entry refers to any more."""
+        with self._lock:
+            data = {"version": _INDEX_VERSION, "entries": self._entries}
+            referenced = set(self._references)
+            text = json.dumps(data)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._index_path.with_name(f"index.json.{os.getpid()}.tmp")
+            tmp_path.write_text(text, encoding="utf-8")
+            os.replace(tmp_path, self._index_path)
+            if self._objects.is_dir():
+                for object_path in self._objects.iterdir():
+                    if object_path.name not in referenced and not object_path.name.endswith(".tmp"):
+                        object_path.unlink()
+        except OSError as exc:
+            print(f"Failed to save the Canvas response cache: {exc}")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+
+__all__ = ["DEFAULT_CACHE_DIR", "DEFAULT_TTLS", "ResponseCache", "endpoint_type"]
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""Keep-alive HTTP client shared by the Canvas sync script and course client."""
+
+from __future__ import annotations
+
+import gzip
+import http.client
+import io
+import threading
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Tuple, TypeVar
+from urllib import error, parse
+
+DEFAULT_TIMEOUT_SECONDS = 30.0
+MAX_IDLE_CONNECTIONS_PER_HOST = 8
+MAX_REDIRECTS = 5
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+PAGE_PREFETCH_WORKERS = 4
+
+_HostKey = Tuple[str, str, int]
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class CanvasHTTPPool:
+    """Reuses HTTP(S) connections per host across GET requests.
+
+    Connections are checked out by one thread at a time and returned to the
+    idle list once the response body has been read, so concurrent callers
+    each get their own socket while sequential pages share one handshake.
+    Failures are raised as ``urllib.error.HTTPError``/``URLError`` so callers
+    keep the error handling they had around ``urlopen``.
+    """
+
+    def __init__(
+        self,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        max_idle_per_host: int = MAX_IDLE_CONNECTIONS_PER_HOST,
+    ) -> None:
+        self.timeout = timeout
+        self.max_idle_per_host = max_idle_per_host
+        self._lock = threading.Lock()
+        self._idle: Dict[_HostKey, List[http.client.HTTPConnection]] = {}
+        self._stats = {"requests": 0, "connections_opened": 0, "connections_reused": 0}
+
+    def get(self, url: str, headers: Dict[str, str]) -> Tuple[bytes, Dict[str, str]]:
+        """GET ``url`` and return the decoded body and response headers."""
+        for _ in range(MAX_REDIRECTS + 1):
+            status, reason, message, body = self._request(url, headers)
+            if status in _REDIRECT_CODES and message.get("Location"):
+                url = parse.urljoin(url, message["Location"])
+                continue
+            if not 200 <= status < 300:
+                raise error.HTTPError(url, status, reason, message, io.BytesIO(body))
+            return body, dict(message.items())
+        raise error.URLError(f"too many redirects for {url}")
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def _request(self, url: str, headers: Dict[str, str]) -> Tuple[int, str, http.client.HTTPMessage, bytes]:
+        parts = parse.urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise error.URLError(f"unsupported URL: {url}")
+        key = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        request_headers = {"Accept-Encoding": "gzip", **headers}
+
+        with self._lock:
+            self._stats["requests"] += 1
+        # A pooled socket may have been closed by the server while idle; that
+        # only shows up on use, so a reused connection gets one fresh retry.
+        while True:
+            connection, reused = self._checkout(key)
+            try:
+                connection.request("GET", target, headers=request_headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, OSError) as exc:
+                connection.close()
+                if reused and isinstance(exc, (http.client.RemoteDisconnected, ConnectionError)):
+                    continue
+                raise error.URLError(exc) from exc
+            break
+
+        if response.will_close:
+            connection.close()
+        else:
+            self._checkin(key, connection)
+
+        encoding = (response.headers.get("Content-Encoding") or "").lower()
+        try:
+            if encoding == "gzip":
+                body = gzip.decompress(body)
+            elif encoding == "deflate":
+                body = zlib.decompress(body)
+        except (OSError, zlib.error) as exc:
+            raise error.URLError(f"could not decode {encoding} response: {exc}") from exc
+        return response.status, response.reason, response.headers, body
+
+    def _checkout(self, key: _HostKey) -> Tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                self._stats["connections_reused"] += 1
+                return idle.pop(), True
+            self._stats["connections_opened"] += 1
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout), False
+        return http.client.HTTPConnection(host, port, timeout=self.timeout), False
+
+    def _checkin(self, key: _HostKey, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(connection)
+                return
+        connection.close()
+
+
+_default_pool = CanvasHTTPPool()
+
+
+def parse_link_header(link_header: str | None) -> Dict[str, str]:
+    """Map each ``rel`` in a ``Link`` header to its URL."""
+    links: Dict[str, str] = {}
+    if not link_header:
+        return links
+    for part in link_header.split(","):
+        section = part.strip()
+        start = section.find("<")
+        end = section.find(">", start + 1)
+        if start == -1 or end == -1:
+            continue
+        for param in section[end + 1 :].split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "rel":
+                for rel in value.strip().strip('"').split():
+                    links.setdefault(rel, section[start + 1 : end])
+    return links
+
+
+def _page_number(query: List[Tuple[str, str]]) -> int | None:
+    for name, value in query:
+        if name == "page":
+            return int(value) if value.isdigit() else None
+    return None
+
+
+def numbered_page_urls(next_url: str, last_url: str) -> List[str] | None:
+    """Return the URLs of pages ``next`` through ``last`` when pages are numbered.
+
+    Canvas paginates most listings with ``page=<n>``; bookmark-style pages
+    (``page=bookmark:...``) cannot be predicted, and None is returned so the
+    caller follows ``rel="next"`` instead.
+    """
+    next_parts = parse.urlsplit(next_url)
+    next_query = parse.parse_qsl(next_parts.query, keep_blank_values=True)
+    first = _page_number(next_query)
+    last = _page_number(parse.parse_qsl(parse.urlsplit(last_url).query, keep_blank_values=True))
+    if first is None or last is None or last < first:
+        return None
+    return [
+        parse.urlunsplit(
+            next_parts._replace(
+                query=parse.urlencode([(name, str(number) if name == "page" else value) for name, value in next_query])
+            )
+        )
+        for number in range(first, last + 1)
+    ]
+
+
+def map_ordered(func: Callable[[T], R], items: Iterable[T], max_workers: int = PAGE_PREFETCH_WORKERS) -> Iterator[R]:
+    """Yield ``func(item)`` in input order while up to ``max_workers`` calls run ahead.
+
+    Only ``max_workers`` results are ever buffered, and closing the iterator
+    early cancels calls that have not started yet.
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="canvas-page")
+    pending: Deque[Future] = deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def canvas_get(url: str, headers: Dict[str, str]) -> Tuple[bytes, Dict[str, str]]:
+    """GET ``url`` through the shared connection pool."""
+    return _default_pool.get(url, headers)
+
+
+def pool_stats() -> Dict[str, int]:
+    """Return request and connection reuse counters for the shared pool."""
+    return _default_pool.stats()
+
+
+__all__ = [
+    "CanvasHTTPPool",
+    "canvas_get",
+    "map_ordered",
+    "numbered_page_urls",
+    "parse_link_header",
+    "pool_stats",
+]
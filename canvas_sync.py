@@ -1,15 +1,27 @@
 from __future__ import annotations
 
+import argparse
 import json
+import os
+import random
 import re
+import signal
 import sys
-from datetime import datetime, timedelta
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from html import unescape
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple, cast
-from urllib import error, parse, request
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Tuple, TypeVar, cast
+from urllib import error, parse
 from zoneinfo import ZoneInfo
 
+from canvas_cache import DEFAULT_CACHE_DIR, DEFAULT_TTLS, ResponseCache
+from canvas_http import PAGE_PREFETCH_WORKERS, canvas_get, map_ordered, numbered_page_urls, parse_link_header
+from study_dashboard import refresh_task_cache
+
 
 LOCAL_TZ = ZoneInfo("Europe/Stockholm")
 UTC_TZ = ZoneInfo("UTC")
@@ -29,6 +41,25 @@ DEFAULT_COURSE_KEYWORDS = [
 DEFAULT_DOCUMENT_KEYWORDS = ["accounting", "scientific", "business", "model", "theory"]
 DOCUMENT_HIGHLIGHT_LIMIT = 5
 HTML_TAG_RE = re.compile(r"<[^>]+>")
+ASSIGNMENT_URL_RE = re.compile(r"/courses/\d+/assignments/(\d+)")
+# Fields a user may have edited locally; a sync never overwrites them.
+PRESERVED_TASK_FIELDS = frozenset({"type"})
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+# Canvas reports its throttle bucket (700 units, refilling roughly 10 per
+# second) in X-Rate-Limit-Remaining and each request's cost in X-Request-Cost.
+RATE_LIMIT_LOW_WATER = 150.0
+RATE_LIMIT_HIGH_WATER = 400.0
+RATE_LIMIT_REFILL_PER_SECOND = 10.0
+RATE_LIMIT_MAX_RETRIES = 5
+RATE_LIMIT_BACKOFF_SECONDS = 1.0
+
+SYNC_STATE_VERSION = 3
+TASK_BACKUP_LIMIT = 5
+DEFAULT_SYNC_INTERVAL_MINUTES = 60.0
+DEFAULT_SYNC_JITTER_SECONDS = 300.0
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 def normalize_keywords(values: Iterable[str] | None, fallback: List[str]) -> List[str]:
@@ -75,54 +106,374 @@ def load_config(config_path: Path) -> Dict[str, object]:
     course_keywords = normalize_keywords(config.get("course_filter_keywords"), DEFAULT_COURSE_KEYWORDS)
     document_keywords = normalize_keywords(config.get("document_focus_keywords"), DEFAULT_DOCUMENT_KEYWORDS)
 
+    max_concurrency = config.get("max_concurrent_requests", DEFAULT_MAX_CONCURRENT_REQUESTS)
+    if isinstance(max_concurrency, bool) or not isinstance(max_concurrency, int) or max_concurrency < 1:
+        print("max_concurrent_requests in canvas_config.json must be a positive integer.")
+        sys.exit(1)
+
+    interval_minutes = config.get("sync_interval_minutes", DEFAULT_SYNC_INTERVAL_MINUTES)
+    jitter_seconds = config.get("sync_jitter_seconds", DEFAULT_SYNC_JITTER_SECONDS)
+    if (
+        isinstance(interval_minutes, bool)
+        or not isinstance(interval_minutes, (int, float))
+        or interval_minutes <= 0
+        or isinstance(jitter_seconds, bool)
+        or not isinstance(jitter_seconds, (int, float))
+        or jitter_seconds < 0
+    ):
+        print("sync_interval_minutes must be positive and sync_jitter_seconds non-negative in canvas_config.json.")
+        sys.exit(1)
+
+    cache_config = config.get("response_cache") or {}
+    if not isinstance(cache_config, dict):
+        print("response_cache in canvas_config.json must be an object.")
+        sys.exit(1)
+    ttls = cache_config.get("ttl_seconds") or {}
+    if not isinstance(ttls, dict) or not all(
+        name in DEFAULT_TTLS and isinstance(value, (int, float)) for name, value in ttls.items()
+    ):
+        print(f"response_cache.ttl_seconds may only set numbers for: {', '.join(DEFAULT_TTLS)}.")
+        sys.exit(1)
+
     return {
         "api_token": api_token,
         "base_url": base_url,
         "course_keywords": course_keywords,
         "document_keywords": document_keywords,
+        "max_concurrency": max_concurrency,
+        "sync_interval_seconds": float(interval_minutes) * 60,
+        "sync_jitter_seconds": float(jitter_seconds),
+        "response_cache": {
+            "enabled": bool(cache_config.get("enabled", False)),
+            "directory": Path(str(cache_config.get("directory") or DEFAULT_CACHE_DIR)).expanduser(),
+            "max_bytes": int(float(cache_config.get("max_mb", 50)) * 1024 * 1024),
+            "ttls": {name: float(value) for name, value in ttls.items()},
+        },
     }
 
 
+def _header_float(headers: Dict[str, str], name: str) -> float | None:
+    raw_value = headers.get(name)
+    if raw_value is None:
+        return None
+    try:
+        return float(raw_value)
+    except ValueError:
+        return None
+
+
+class RateLimitScheduler:
+    """Gate Canvas requests on the throttle headers of earlier responses.
+
+    At most ``limit`` requests are in flight. The limit drops by one while
+    ``X-Rate-Limit-Remaining`` sits below the low-water mark, halves on a
+    throttled response and climbs back towards ``max_concurrency`` once the
+    bucket is healthy again. Below the low-water mark request starts are also
+    spaced by the average ``X-Request-Cost`` over the refill rate.
+    """
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENT_REQUESTS) -> None:
+        self._condition = threading.Condition()
+        self.max_concurrency = max_concurrency
+        self.limit = max_concurrency
+        self._in_flight = 0
+        self._remaining: float | None = None
+        self._average_cost = 1.0
+        self._next_start = 0.0
+        self._stats = {"requests": 0, "throttled": 0}
+
+    def configure(self, max_concurrency: int) -> None:
+        with self._condition:
+            self.max_concurrency = max_concurrency
+            self.limit = max_concurrency
+            self._condition.notify_all()
+
+    def get(self, url: str, headers: Dict[str, str]) -> Tuple[bytes, Dict[str, str]]:
+        """Run ``canvas_get`` once a slot is free and learn from the response headers."""
+        self._acquire()
+        response_headers: Dict[str, str] = {}
+        try:
+            body, response_headers = canvas_get(url, headers)
+            return body, response_headers
+        except error.HTTPError as http_error:
+            response_headers = dict(http_error.headers.items())
+            raise
+        finally:
+            self._release(response_headers)
+
+    def record_throttled(self) -> None:
+        with self._condition:
+            self._stats["throttled"] += 1
+            self.limit = max(1, self.limit // 2)
+
+    def stats(self) -> Dict[str, float]:
+        with self._condition:
+            return {**self._stats, "limit": self.limit, "remaining": self._remaining or 0.0}
+
+    def _acquire(self) -> None:
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+            self._stats["requests"] += 1
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            if self._remaining is not None and self._remaining < RATE_LIMIT_LOW_WATER:
+                self._next_start = start + self._average_cost / RATE_LIMIT_REFILL_PER_SECOND
+            delay = start - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def _release(self, response_headers: Dict[str, str]) -> None:
+        remaining = _header_float(response_headers, "X-Rate-Limit-Remaining")
+        cost = _header_float(response_headers, "X-Request-Cost")
+        with self._condition:
+            self._in_flight -= 1
+            if cost is not None:
+                self._average_cost = 0.8 * self._average_cost + 0.2 * cost
+            if remaining is not None:
+                self._remaining = remaining
+                if remaining < RATE_LIMIT_LOW_WATER:
+                    self.limit = max(1, self.limit - 1)
+                elif remaining >= RATE_LIMIT_HIGH_WATER and self.limit < self.max_concurrency:
+                    self.limit += 1
+            self._condition.notify_all()
+
+
+_rate_limiter = RateLimitScheduler()
+_response_cache: ResponseCache | None = None
+
+
+def is_rate_limited(http_error: error.HTTPError) -> bool:
+    """Tell Canvas throttling apart from a real 403 permission error."""
+    if http_error.code != 403:
+        return False
+    remaining = _header_float(dict(http_error.headers.items()), "X-Rate-Limit-Remaining")
+    if remaining is not None and remaining <= 0:
+        return True
+    try:
+        body = http_error.read()
+    except OSError:
+        return False
+    return b"rate limit exceeded" in body.lower()
+
+
+def _retry_delay(http_error: error.HTTPError, attempt: int) -> float:
+    retry_after = _header_float(dict(http_error.headers.items()), "Retry-After")
+    if retry_after is not None:
+        return retry_after
+    backoff = RATE_LIMIT_BACKOFF_SECONDS * 2**attempt
+    return backoff + random.uniform(0, RATE_LIMIT_BACKOFF_SECONDS)
+
+
+def map_concurrently(func: Callable[[T], R], items: Sequence[T], max_workers: int) -> List[R]:
+    """Apply ``func`` to ``items`` on up to ``max_workers`` threads, keeping input order.
+
+    The first failure (including ``sys.exit`` from a worker) is re-raised in
+    the caller after pending work is cancelled.
+    """
+    if max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items)), thread_name_prefix="canvas-sync") as executor:
+        futures = [executor.submit(func, item) for item in items]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
 def request_canvas(
     url: str,
     headers: Dict[str, str],
     *,
     suppress_auth_error: bool = False,
 ) -> Tuple[str | None, Dict[str, str]]:
-    req = request.Request(url, headers=headers)
-    try:
-        with request.urlopen(req, timeout=30) as response:
-            data = response.read().decode("utf-8")
-            return data, dict(response.headers.items())
-    except error.HTTPError as http_error:
-        if http_error.code in (401, 403):
-            if suppress_auth_error:
-                return None, {}
-            print("Canvas authentication failed.")
-            sys.exit(1)
-        if http_error.code == 404 and suppress_auth_error:
-            return None, {}
-        print(f"HTTP error while contacting Canvas: {http_error}")
-        sys.exit(1)
-    except error.URLError as url_error:
-        print(f"Network error while contacting Canvas: {url_error}")
+    _, data, response_headers = request_canvas_status(url, headers, suppress_auth_error=suppress_auth_error)
+    return data, response_headers
+
+
+def request_canvas_status(
+    url: str,
+    headers: Dict[str, str],
+    *,
+    suppress_auth_error: bool = False,
+) -> Tuple[int, str | None, Dict[str, str]]:
+    """Like ``request_canvas`` but also returns the status, passing 304 through with no body.
+
+    With the response cache enabled, fresh entries are answered locally and
+    stale ones revalidated with their ETag unless the caller sent validators
+    of its own. A 304 to the caller's validators also refreshes the entry when
+    its ETag matches the cached one. Offline, only the cache is consulted.
+    """
+    cache = _response_cache
+    if cache is None:
+        return _request_canvas_network(url, headers, suppress_auth_error=suppress_auth_error)
+
+    cached = cache.lookup(url, headers)
+    if cached is not None and cached.fresh:
+        if cached.status != 200:
+            return cached.status, None, {}
+        return 200, cached.body.decode("utf-8"), cached.headers
+    if cache.offline:
+        print(f"Offline mode: no cached response for {url}")
         sys.exit(1)
 
+    request_headers = headers
+    revalidating = False
+    if cached is not None and cached.status == 200 and "If-None-Match" not in headers and "If-Modified-Since" not in headers:
+        request_headers = {**headers, **cached.validators()}
+        revalidating = bool(cached.validators())
+    status, data, response_headers = _request_canvas_network(
+        url, request_headers, suppress_auth_error=suppress_auth_error
+    )
+    if status == 304 and cached is not None:
+        if revalidating:
+            cache.revalidated(url, headers)
+            return 200, cached.body.decode("utf-8"), cached.headers
+        etag = cached.headers.get("ETag")
+        if cached.status == 200 and etag and headers.get("If-None-Match") == etag:
+            cache.revalidated(url, headers)
+    if status == 200 and data is not None:
+        cache.store(url, headers, data.encode("utf-8"), response_headers)
+    elif status in (401, 403, 404):
+        # Only reached for suppressed errors, e.g. a course without file access.
+        cache.store(url, headers, b"", {}, status=status)
+    return status, data, response_headers
+
+
+def _request_canvas_network(
+    url: str,
+    headers: Dict[str, str],
+    *,
+    suppress_auth_error: bool = False,
+) -> Tuple[int, str | None, Dict[str, str]]:
+    """Send the request; throttled responses are retried with exponential backoff."""
+    attempt = 0
+    while True:
+        try:
+            body, response_headers = _rate_limiter.get(url, headers)
+            return 200, body.decode("utf-8"), response_headers
+        except error.HTTPError as http_error:
+            if http_error.code == 304:
+                return 304, None, dict(http_error.headers.items())
+            if is_rate_limited(http_error):
+                _rate_limiter.record_throttled()
+                if attempt < RATE_LIMIT_MAX_RETRIES:
+                    time.sleep(_retry_delay(http_error, attempt))
+                    attempt += 1
+                    continue
+                print(f"Canvas rate limit still exceeded after {RATE_LIMIT_MAX_RETRIES} retries.")
+                sys.exit(1)
+            if http_error.code in (401, 403):
+                if suppress_auth_error:
+                    return http_error.code, None, {}
+                print("Canvas authentication failed.")
+                sys.exit(1)
+            if http_error.code == 404 and suppress_auth_error:
+                return 404, None, {}
+            print(f"HTTP error while contacting Canvas: {http_error}")
+            sys.exit(1)
+        except error.URLError as url_error:
+            print(f"Network error while contacting Canvas: {url_error}")
+            sys.exit(1)
 
-def parse_next_link(link_header: str | None) -> str | None:
-    if not link_header:
-        return None
 
-    for part in link_header.split(","):
-        section = part.strip()
-        if 'rel="next"' not in section:
-            continue
-        start = section.find("<")
-        end = section.find(">", start + 1)
-        if start == -1 or end == -1:
-            continue
-        return section[start + 1 : end]
-    return None
+class SyncState:
+    """Validators and watermarks remembered between ``canvas_sync`` runs.
+
+    ``pages`` maps a page URL to its ETag/Last-Modified, the compact records
+    the caller kept from that page (never the raw Canvas JSON) and its
+    ``Link`` relations, so a 304 can be answered from disk;
+    ``file_watermarks`` holds the newest raw ``updated_at`` seen per course.
+    Only entries used during a run are written back, so the file does not
+    accumulate stale URLs.
+    """
+
+    def __init__(self, path: Path, data: Dict[str, object] | None = None) -> None:
+        self.path = path
+        data = data or {}
+        self._pages = cast(Dict[str, Dict[str, object]], data.get("pages") or {})
+        self._file_watermarks = cast(Dict[str, str], data.get("file_watermarks") or {})
+        self._used_pages: Dict[str, Dict[str, object]] = {}
+        self._used_watermarks: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Path, *, full: bool = False) -> "SyncState":
+        if full or not path.exists():
+            return cls(path)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as exc:
+            print(f"Ignoring unreadable {path.name}: {exc}")
+            return cls(path)
+        if not isinstance(data, dict) or data.get("version") != SYNC_STATE_VERSION:
+            return cls(path)
+        return cls(path, data)
+
+    def validators(self, url: str) -> Dict[str, str]:
+        with self._lock:
+            entry = self._pages.get(url)
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = cast(str, entry["etag"])
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = cast(str, entry["last_modified"])
+        return headers
+
+    def cached_page(self, url: str) -> Tuple[object, Dict[str, str]] | None:
+        with self._lock:
+            entry = self._pages.get(url)
+            if entry is None:
+                return None
+            self._used_pages[url] = entry
+        return entry.get("body"), cast(Dict[str, str], entry.get("links") or {})
+
+    def remember_page(
+        self,
+        url: str,
+        response_headers: Dict[str, str],
+        records: List[Dict[str, object]],
+        links: Dict[str, str],
+    ) -> None:
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        entry = {"etag": etag, "last_modified": last_modified, "body": records, "links": links}
+        with self._lock:
+            self._pages[url] = entry
+            self._used_pages[url] = entry
+
+    def file_watermark(self, course_id: object) -> str | None:
+        with self._lock:
+            return self._file_watermarks.get(str(course_id))
+
+    def set_file_watermark(self, course_id: object, updated_at: str | None) -> None:
+        if not updated_at:
+            return
+        with self._lock:
+            self._file_watermarks[str(course_id)] = updated_at
+            self._used_watermarks[str(course_id)] = updated_at
+
+    def save(self) -> None:
+        with self._lock:
+            data = {
+                "version": SYNC_STATE_VERSION,
+                "pages": self._used_pages,
+                "file_watermarks": self._used_watermarks,
+            }
+            # Start the next run (in daemon mode) from what this one used.
+            self._pages, self._used_pages = self._used_pages, {}
+            self._file_watermarks, self._used_watermarks = self._used_watermarks, {}
+        try:
+            write_text_atomic(self.path, json.dumps(data))
+        except OSError as exc:
+            print(f"Failed to write {self.path.name}: {exc}")
 
 
 def fetch_json(url: str, headers: Dict[str, str], params: Dict[str, Iterable[str] | str] | None = None):
@@ -142,34 +493,130 @@ def fetch_json(url: str, headers: Dict[str, str], params: Dict[str, Iterable[str
         sys.exit(1)
 
 
-def fetch_paginated_list(
+def fetch_page(
+    url: str,
+    headers: Dict[str, str],
+    state: SyncState | None = None,
+    *,
+    suppress_auth_error: bool = False,
+    compact: Callable[[Dict[str, object]], Dict[str, object]] | None = None,
+) -> Tuple[object | None, Dict[str, str]]:
+    """Return one decoded JSON page and its ``Link`` relations.
+
+    ``compact`` reduces each item of a list page to the record the caller
+    needs, so raw Canvas objects are dropped as soon as the page is decoded.
+    Only compacted pages are kept in ``state``: their requests carry the
+    stored validators and a 304 is answered from the stored records. The
+    body is None only when ``suppress_auth_error`` swallowed a 401/403/404.
+    """
+    if compact is None:
+        # Raw pages are never persisted, so there is nothing to revalidate against.
+        state = None
+    request_headers = dict(headers)
+    if state is not None:
+        request_headers.update(state.validators(url))
+    status, data, response_headers = request_canvas_status(
+        url, request_headers, suppress_auth_error=suppress_auth_error
+    )
+    if status == 304:
+        cached = state.cached_page(url) if state is not None else None
+        if cached is not None:
+            return cached
+        # Validators without a stored body should not happen; refetch in full.
+        status, data, response_headers = request_canvas_status(
+            url, headers, suppress_auth_error=suppress_auth_error
+        )
+    if data is None:
+        return None, {}
+    try:
+        page = json.loads(data)
+    except json.JSONDecodeError as json_error:
+        print(f"Invalid JSON from Canvas: {json_error}")
+        sys.exit(1)
+    links = parse_link_header(response_headers.get("Link"))
+    if compact is not None and isinstance(page, list):
+        page = [compact(item) for item in page if isinstance(item, dict)]
+        if state is not None:
+            state.remember_page(url, response_headers, page, links)
+    return page, links
+
+
+def iter_pages(
+    url: str,
+    headers: Dict[str, str],
+    state: SyncState | None = None,
+    *,
+    suppress_auth_error: bool = False,
+    prefetch: int = PAGE_PREFETCH_WORKERS,
+    compact: Callable[[Dict[str, object]], Dict[str, object]] | None = None,
+) -> Iterator[object | None]:
+    """Yield decoded pages in order.
+
+    When the first page's ``rel="last"`` link carries a page number, the
+    remaining page URLs are computed upfront and up to ``prefetch`` of them
+    are fetched concurrently. Otherwise (or with ``prefetch=1``) the
+    ``rel="next"`` links are followed one round trip at a time.
+    """
+    page, links = fetch_page(url, headers, state, suppress_auth_error=suppress_auth_error, compact=compact)
+    yield page
+    next_url = links.get("next")
+    if not next_url:
+        return
+
+    page_urls = None
+    if prefetch > 1 and "last" in links:
+        page_urls = numbered_page_urls(next_url, links["last"])
+    if page_urls is not None:
+        yield from map_ordered(
+            lambda page_url: fetch_page(
+                page_url, headers, state, suppress_auth_error=suppress_auth_error, compact=compact
+            )[0],
+            page_urls,
+            prefetch,
+        )
+        return
+
+    while next_url:
+        page, links = fetch_page(next_url, headers, state, suppress_auth_error=suppress_auth_error, compact=compact)
+        yield page
+        next_url = links.get("next")
+
+
+def iter_paginated_list(
     url: str,
     headers: Dict[str, str],
     params: Dict[str, Iterable[str] | str] | None = None,
-) -> List[Dict[str, object]]:
-    next_url = url
+    state: SyncState | None = None,
+    compact: Callable[[Dict[str, object]], Dict[str, object]] | None = None,
+) -> Iterator[Dict[str, object]]:
+    """Yield the items of a paginated listing, holding at most a few pages at a time.
+
+    Pages are requested as the consumer advances (a small prefetch window
+    ahead when they are numbered), so stopping early also stops the downloads.
+    """
     if params:
-        next_url = f"{url}?{parse.urlencode(params, doseq=True)}"
+        url = f"{url}?{parse.urlencode(params, doseq=True)}"
 
-    collected: List[Dict[str, object]] = []
-    while next_url:
-        data, response_headers = request_canvas(next_url, headers)
-        if data is None:
+    for page in iter_pages(url, headers, state, compact=compact):
+        if page is None:
             print("Canvas returned an empty response while fetching paginated data.")
             sys.exit(1)
-        try:
-            page = json.loads(data)
-        except json.JSONDecodeError as json_error:
-            print(f"Invalid JSON from Canvas: {json_error}")
-            sys.exit(1)
 
         if not isinstance(page, list):
             print("Expected a list response from Canvas when fetching paginated data.")
             sys.exit(1)
 
-        collected.extend(page)
-        next_url = parse_next_link(response_headers.get("Link"))
-    return collected
+        yield from page
+
+
+def fetch_paginated_list(
+    url: str,
+    headers: Dict[str, str],
+    params: Dict[str, Iterable[str] | str] | None = None,
+    state: SyncState | None = None,
+    compact: Callable[[Dict[str, object]], Dict[str, object]] | None = None,
+) -> List[Dict[str, object]]:
+    return list(iter_paginated_list(url, headers, params, state, compact))
 
 
 def parse_due_at(value: str | None) -> datetime | None:
@@ -201,6 +648,43 @@ def to_local_timestamp(value: str | None) -> str | None:
     return parsed.astimezone(LOCAL_TZ).strftime("%Y-%m-%d %H:%M")
 
 
+def compact_assignment(assignment: Dict[str, object]) -> Dict[str, object]:
+    """Keep what ``assignment_to_task`` needs, with the description already excerpted."""
+    record = {field: assignment[field] for field in ("name", "due_at", "html_url") if field in assignment}
+    description = assignment.get("description")
+    record["description_excerpt"] = format_description_excerpt(description if isinstance(description, str) else None)
+    return record
+
+
+def assignment_to_task(
+    assignment: Dict[str, object],
+    course_name: str,
+    window_start: date,
+    window_end: date,
+) -> Dict[str, object] | None:
+    """Return the task entry for a ``compact_assignment`` record due inside the window, else None."""
+    due_at = assignment.get("due_at")
+    local_due = parse_due_at(due_at if isinstance(due_at, str) else None)
+    if local_due is None:
+        return None
+    local_due_date = local_due.date()
+    if local_due_date < window_start or local_due_date > window_end:
+        return None
+
+    description_excerpt = assignment.get("description_excerpt")
+    task_entry: Dict[str, object] = {
+        "title": assignment.get("name", "Untitled assignment"),
+        "course": course_name,
+        "due_date": local_due.strftime("%Y-%m-%d"),
+        "due_time": local_due.strftime("%H:%M"),
+        "type": "assignment",
+        "canvas_url": assignment.get("html_url", ""),
+    }
+    if description_excerpt:
+        task_entry["description"] = description_excerpt
+    return task_entry
+
+
 def format_description_excerpt(value: str | None, limit: int = 300) -> str:
     if not value:
         return ""
@@ -236,35 +720,106 @@ def read_tasks(tasks_path: Path) -> Tuple[List[Dict[str, object]], str]:
     return tasks, original_text
 
 
+def serialize_json(data: object) -> str:
+    return json.dumps(data, indent=2) + "\n"
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    """Replace ``path`` in one step so readers never see a partial file."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            handle.write(text)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def write_json_if_changed(path: Path, data: object) -> bool:
+    """Atomically write ``data`` as JSON unless the file already holds exactly that text."""
+    text = serialize_json(data)
+    try:
+        if path.read_text(encoding="utf-8") == text:
+            return False
+    except OSError:
+        pass
+    try:
+        write_text_atomic(path, text)
+    except OSError as exc:
+        print(f"Failed to write {path.name}: {exc}")
+        sys.exit(1)
+    return True
+
+
+def rotate_backups(backup_path: Path, text: str, limit: int = TASK_BACKUP_LIMIT) -> None:
+    """Save ``text`` as the newest backup, keeping ``limit`` older ones as ``<stem>.1`` to ``<stem>.<limit>``."""
+    history = [backup_path.with_name(f"{backup_path.stem}.{index}{backup_path.suffix}") for index in range(1, limit + 1)]
+    if backup_path.exists() and backup_path.read_text(encoding="utf-8") == text:
+        return
+    for older, newer in zip(reversed(history), reversed([backup_path] + history[:-1])):
+        if newer.exists():
+            os.replace(newer, older)
+    write_text_atomic(backup_path, text)
+
+
 def write_tasks(
     tasks_path: Path,
     backup_path: Path,
     original_text: str,
     tasks: List[Dict[str, object]],
-) -> None:
+) -> bool:
+    """Persist ``tasks`` unless they serialize to ``original_text``; returns whether it wrote.
+
+    The previous contents go to a rotating backup first, and ``tasks.json`` is
+    replaced atomically, so the dashboard never reads a half-written file and
+    its mtime-keyed caches survive syncs that change nothing.
+    """
+    new_text = serialize_json(tasks)
+    if new_text == original_text and tasks_path.exists():
+        return False
+
     try:
-        backup_path.write_text(original_text, encoding="utf-8")
+        rotate_backups(backup_path, original_text)
     except OSError as exc:
         print(f"Failed to write backup {backup_path.name}: {exc}")
         sys.exit(1)
 
     try:
-        with tasks_path.open("w", encoding="utf-8") as handle:
-            json.dump(tasks, handle, indent=2)
-            handle.write("\n")
+        write_text_atomic(tasks_path, new_text)
     except OSError as exc:
         print(f"Failed to write {tasks_path.name}: {exc}")
         sys.exit(1)
+    return True
 
 
-def write_documents(documents_path: Path, documents: Dict[str, List[Dict[str, object]]]) -> None:
+def read_documents(documents_path: Path) -> Dict[str, List[Dict[str, object]]]:
+    """Return the previous document catalog, or an empty one when it is missing or unreadable."""
     try:
-        with documents_path.open("w", encoding="utf-8") as handle:
-            json.dump(documents, handle, indent=2)
-            handle.write("\n")
-    except OSError as exc:
-        print(f"Failed to write {documents_path.name}: {exc}")
-        sys.exit(1)
+        documents = json.loads(documents_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(documents, dict):
+        return {}
+    return {name: docs for name, docs in documents.items() if isinstance(docs, list)}
+
+
+def write_documents(documents_path: Path, documents: Dict[str, List[Dict[str, object]]]) -> None:
+    write_json_if_changed(documents_path, documents)
+
+
+def compact_course(course: Dict[str, object]) -> Dict[str, object]:
+    """Keep the course fields the sync reads (see ``simplify_courses``)."""
+    record = {field: course[field] for field in ("id", "name", "workflow_state", "course_code") if field in course}
+    term = course.get("term")
+    if isinstance(term, dict):
+        record["term"] = {"name": term.get("name")}
+    return record
 
 
 def simplify_courses(courses: List[Dict[str, object]]) -> List[Dict[str, object]]:
@@ -292,13 +847,7 @@ def simplify_courses(courses: List[Dict[str, object]]) -> List[Dict[str, object]
 
 
 def write_courses(courses_path: Path, courses: List[Dict[str, object]]) -> None:
-    try:
-        with courses_path.open("w", encoding="utf-8") as handle:
-            json.dump(courses, handle, indent=2)
-            handle.write("\n")
-    except OSError as exc:
-        print(f"Failed to write {courses_path.name}: {exc}")
-        sys.exit(1)
+    write_json_if_changed(courses_path, courses)
 
 
 def build_task_key(task: Dict[str, object]) -> Tuple[str, str, str, str]:
@@ -310,13 +859,162 @@ def build_task_key(task: Dict[str, object]) -> Tuple[str, str, str, str]:
     )
 
 
+def canvas_assignment_id(task: Dict[str, object]) -> str | None:
+    canvas_url = task.get("canvas_url")
+    if not isinstance(canvas_url, str):
+        return None
+    match = ASSIGNMENT_URL_RE.search(canvas_url)
+    return match.group(1) if match else None
+
+
+class TaskIndex:
+    """Existing tasks keyed by Canvas assignment id, falling back to ``build_task_key``.
+
+    ``upsert`` matches a synced task in O(1), updates only the fields that
+    differ (never ``PRESERVED_TASK_FIELDS``) and records what happened in
+    ``changes``. Matching by id lets renamed or rescheduled assignments update
+    their existing entry instead of adding a second one.
+    """
+
+    def __init__(self, tasks: List[Dict[str, object]]) -> None:
+        self.tasks = tasks
+        self._by_id: Dict[str, Dict[str, object]] = {}
+        self._by_key: Dict[Tuple[str, str, str, str], Dict[str, object]] = {}
+        self.changes: Dict[str, List[Dict[str, object]]] = {"added": [], "updated": [], "unchanged": []}
+        for task in tasks:
+            if isinstance(task, dict):
+                self._index(task)
+
+    def _index(self, task: Dict[str, object]) -> None:
+        assignment_id = canvas_assignment_id(task)
+        if assignment_id is not None:
+            self._by_id.setdefault(assignment_id, task)
+        self._by_key.setdefault(build_task_key(task), task)
+
+    def find(self, task: Dict[str, object]) -> Dict[str, object] | None:
+        assignment_id = canvas_assignment_id(task)
+        if assignment_id is not None and assignment_id in self._by_id:
+            return self._by_id[assignment_id]
+        return self._by_key.get(build_task_key(task))
+
+    def upsert(self, task: Dict[str, object]) -> str:
+        """Merge ``task`` into the list; returns "added", "updated" or "unchanged"."""
+        existing = self.find(task)
+        if existing is None:
+            self.tasks.append(task)
+            self._index(task)
+            self.changes["added"].append(self._describe(task))
+            return "added"
+
+        changed_fields = [
+            field
+            for field, value in task.items()
+            if field not in PRESERVED_TASK_FIELDS and existing.get(field) != value
+        ]
+        if not changed_fields:
+            self.changes["unchanged"].append(self._describe(existing))
+            return "unchanged"
+
+        old_key = build_task_key(existing)
+        for field in changed_fields:
+            existing[field] = task[field]
+        new_key = build_task_key(existing)
+        if new_key != old_key:
+            if self._by_key.get(old_key) is existing:
+                del self._by_key[old_key]
+            self._by_key.setdefault(new_key, existing)
+        self.changes["updated"].append({**self._describe(existing), "fields": changed_fields})
+        return "updated"
+
+    @staticmethod
+    def _describe(task: Dict[str, object]) -> Dict[str, object]:
+        return {
+            "id": canvas_assignment_id(task),
+            "course": task.get("course", ""),
+            "title": task.get("title", ""),
+        }
+
+
+def fetch_course_files(
+    files_url: str,
+    headers: Dict[str, str],
+    state: SyncState | None = None,
+    watermark: str | None = None,
+) -> Tuple[List[Dict[str, object]], bool, str | None] | None:
+    """Return a course's simplified files, newest first, or None when the token lacks file access.
+
+    Raw Canvas file objects are compacted as each page is decoded; neither
+    memory nor the sync state keeps them.
+
+    With a ``watermark`` (the newest raw ``updated_at`` of the previous run)
+    paging stops at the first file older than it. The result also says
+    whether that happened, i.e. whether older files must come from the
+    previous catalog, and carries the newest raw ``updated_at`` fetched.
+    """
+    params = {
+        "per_page": "100",
+        "sort": "updated_at",
+        "order": "desc",
+    }
+    url = f"{files_url}?{parse.urlencode(params, doseq=True)}"
+    files: List[Dict[str, object]] = []
+    newest: str | None = None
+    # Paging may stop early at the watermark, so only prefetch full listings.
+    prefetch = 1 if watermark else PAGE_PREFETCH_WORKERS
+    for page in iter_pages(
+        url, headers, state, suppress_auth_error=True, prefetch=prefetch, compact=compact_file
+    ):
+        if page is None:
+            return None
+        if not isinstance(page, list):
+            break
+        for record in page:
+            updated_at = record.get("updated_at")
+            if isinstance(updated_at, str):
+                # ISO-8601 UTC timestamps from Canvas compare correctly as strings.
+                if watermark and updated_at < watermark:
+                    return files, True, newest
+                if newest is None or updated_at > newest:
+                    newest = updated_at
+            files.append(simplify_file(record))
+    return files, False, newest
+
+
+def compact_file(file_data: Dict[str, object]) -> Dict[str, object]:
+    """Keep the catalog fields of a Canvas file; ``updated_at`` stays raw for the watermark."""
+    return {
+        "id": file_data.get("id"),
+        "name": file_data.get("display_name") or file_data.get("filename"),
+        "content_type": file_data.get("content-type") or file_data.get("content_type"),
+        "size": file_data.get("size"),
+        "updated_at": file_data.get("updated_at"),
+        "url": file_data.get("url"),
+    }
+
+
+def simplify_file(record: Dict[str, object]) -> Dict[str, object]:
+    """Return a ``compact_file`` record with ``updated_at`` in local time, as cataloged."""
+    updated_at = record.get("updated_at")
+    return {**record, "updated_at": to_local_timestamp(updated_at if isinstance(updated_at, str) else None)}
+
+
 def collect_course_documents(
     courses: List[Dict[str, object]],
     headers: Dict[str, str],
     base_url: str,
     focus_keywords: List[str],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+    state: SyncState | None = None,
+    previous_documents: Dict[str, List[Dict[str, object]]] | None = None,
 ) -> Dict[str, List[Dict[str, object]]]:
-    documents_map: Dict[str, List[Dict[str, object]]] = {}
+    """Catalog files per course.
+
+    Given ``state`` and the previous catalog, only files changed since the
+    last run are downloaded and merged in front of the previously known ones.
+    Deleted files are only noticed by a full sync.
+    """
+    previous_documents = previous_documents or {}
+    focus_courses: List[Tuple[str, object, str | None]] = []
     for course in courses:
         course_name = course.get("name")
         course_id = course.get("id")
@@ -326,75 +1024,93 @@ def collect_course_documents(
             continue
         if not course_matches_keywords(course_name, focus_keywords):
             continue
+        watermark = None
+        if state is not None and course_name in previous_documents:
+            watermark = state.file_watermark(course_id)
+        focus_courses.append((course_name, course_id, watermark))
+
+    course_files = map_concurrently(
+        lambda entry: fetch_course_files(f"{base_url}/courses/{entry[1]}/files", headers, state, entry[2]),
+        focus_courses,
+        max_concurrency,
+    )
 
-        files_url = f"{base_url}/courses/{course_id}/files"
-        params = {
-            "per_page": "100",
-            "sort": "updated_at",
-            "order": "desc",
-        }
-        next_url = f"{files_url}?{parse.urlencode(params, doseq=True)}"
-        files: List[Dict[str, object]] = []
-        unauthorized = False
-        while next_url:
-            data, response_headers = request_canvas(next_url, headers, suppress_auth_error=True)
-            if data is None:
-                unauthorized = True
-                break
-            try:
-                page = json.loads(data)
-            except json.JSONDecodeError as json_error:
-                print(f"Invalid JSON from Canvas: {json_error}")
-                sys.exit(1)
-            if not isinstance(page, list):
-                break
-            for file_data in page:
-                if isinstance(file_data, dict):
-                    files.append(file_data)
-            next_url = parse_next_link(response_headers.get("Link"))
-
-        if unauthorized:
+    documents_map: Dict[str, List[Dict[str, object]]] = {}
+    for (course_name, course_id, watermark), result in zip(focus_courses, course_files):
+        if result is None:
             print(f"Skipping documents for {course_name}: Canvas token lacks file access.")
             continue
 
-        if not files:
-            continue
+        simplified, reached_watermark, newest = result
+        if state is not None:
+            state.set_file_watermark(course_id, newest or watermark)
 
-        simplified = []
-        for file_data in files:
-            if not isinstance(file_data, dict):
-                continue
-            simplified.append(
-                {
-                    "id": file_data.get("id"),
-                    "name": file_data.get("display_name") or file_data.get("filename"),
-                    "content_type": file_data.get("content-type") or file_data.get("content_type"),
-                    "size": file_data.get("size"),
-                    "updated_at": to_local_timestamp(
-                        file_data.get("updated_at") if isinstance(file_data.get("updated_at"), str) else None
-                    ),
-                    "url": file_data.get("url"),
-                }
+        if reached_watermark:
+            fetched_ids = {doc["id"] for doc in simplified}
+            simplified.extend(
+                doc for doc in previous_documents.get(course_name, []) if doc.get("id") not in fetched_ids
             )
+
+        if not simplified:
+            continue
         documents_map[course_name] = simplified
     return documents_map
 
 
-def main() -> None:
-    home_dir = Path.home()
-    config_path = home_dir / "canvas_config.json"
+def configure_response_cache(settings: Dict[str, object], *, enabled: bool = False, offline: bool = False) -> None:
+    """Install the on-disk response cache when enabled by config or flags."""
+    global _response_cache
+    if not (enabled or settings.get("enabled")):
+        _response_cache = None
+        return
+    _response_cache = ResponseCache(
+        cast(Path, settings["directory"]),
+        max_bytes=cast(int, settings["max_bytes"]),
+        ttls=cast(Dict[str, float], settings["ttls"]),
+        offline=offline,
+    )
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Sync upcoming Canvas assignments and documents.")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="ignore the saved sync state and download everything again",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="keep Canvas responses in the on-disk response cache (also enabled by response_cache.enabled)",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="keep running and sync every sync_interval_minutes; send SIGUSR1 to sync immediately",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="replay responses from the response cache without contacting Canvas",
+    )
+    return parser.parse_args(argv)
+
+
+def sync_once(config: Dict[str, object], state: SyncState, home_dir: Path) -> None:
+    """Run one full or incremental sync and write the JSON files in ``home_dir``."""
     tasks_path = home_dir / "tasks.json"
     backup_path = home_dir / "tasks_backup_before_canvas.json"
     documents_path = home_dir / "canvas_documents.json"
     courses_path = home_dir / "canvas_courses.json"
+    changes_path = home_dir / "canvas_task_changes.json"
 
-    config = load_config(config_path)
     headers = {
         "Authorization": f"Bearer {config['api_token']}",
         "Accept": "application/json",
     }
     course_keywords = cast(List[str], config["course_keywords"])
     document_keywords = cast(List[str], config["document_keywords"])
+    max_concurrency = cast(int, config["max_concurrency"])
 
     courses_url = f"{config['base_url']}/courses"
     courses = fetch_paginated_list(
@@ -405,11 +1121,21 @@ def main() -> None:
             "include[]": ["term"],
             "per_page": "100",
         },
+        state=state,
+        compact=compact_course,
     )
 
     available_courses = [course for course in courses if course.get("workflow_state") == "available"]
 
-    document_data = collect_course_documents(available_courses, headers, cast(str, config["base_url"]), document_keywords)
+    document_data = collect_course_documents(
+        available_courses,
+        headers,
+        cast(str, config["base_url"]),
+        document_keywords,
+        max_concurrency,
+        state=state,
+        previous_documents=read_documents(documents_path),
+    )
     write_documents(documents_path, document_data)
     document_highlights = {}
     for course_name, docs in document_data.items():
@@ -439,35 +1165,29 @@ def main() -> None:
             continue
         filtered_courses.append(course)
 
-        assignments_url = f"{config['base_url']}/courses/{course_id}/assignments"
-        assignments = fetch_paginated_list(
-            assignments_url,
+    def fetch_course_tasks(course: Dict[str, object]) -> Tuple[int, List[Dict[str, object]]]:
+        assignment_count = 0
+        course_tasks: List[Dict[str, object]] = []
+        for assignment in iter_paginated_list(
+            f"{config['base_url']}/courses/{course['id']}/assignments",
             headers,
             params={"bucket": "upcoming", "per_page": "100"},
-        )
-
-        total_assignments += len(assignments)
-
-        for assignment in assignments:
-            due_at = assignment.get("due_at")
-            local_due = parse_due_at(due_at)
-            if local_due is None:
-                continue
-            local_due_date = local_due.date()
-            if local_due_date < window_start or local_due_date > window_end:
-                continue
-
-            description_excerpt = format_description_excerpt(assignment.get("description"))
-            task_entry: Dict[str, object] = {
-                "title": assignment.get("name", "Untitled assignment"),
-                "course": course_name,
-                "due_date": local_due.strftime("%Y-%m-%d"),
-                "due_time": local_due.strftime("%H:%M"),
-                "type": "assignment",
-                "canvas_url": assignment.get("html_url", ""),
-            }
-            if description_excerpt:
-                task_entry["description"] = description_excerpt
+            state=state,
+            compact=compact_assignment,
+        ):
+            assignment_count += 1
+            task_entry = assignment_to_task(assignment, cast(str, course["name"]), window_start, window_end)
+            if task_entry is not None:
+                course_tasks.append(task_entry)
+        return assignment_count, course_tasks
+
+    course_results = map_concurrently(fetch_course_tasks, filtered_courses, max_concurrency)
+
+    for course, (assignment_count, course_tasks) in zip(filtered_courses, course_results):
+        course_name = cast(str, course["name"])
+        total_assignments += assignment_count
+
+        for task_entry in course_tasks:
             if course_name in document_highlights:
                 highlights = document_highlights[course_name]
                 if highlights:
@@ -476,39 +1196,101 @@ def main() -> None:
             assignments_collected.append(task_entry)
 
     existing_tasks, original_text = read_tasks(tasks_path)
-    existing_keys = {build_task_key(task) for task in existing_tasks}
-    task_lookup = {build_task_key(task): task for task in existing_tasks}
-    preserved_fields = {"title", "course", "due_date", "due_time", "type"}
-
-    new_tasks_added = 0
+    task_index = TaskIndex(existing_tasks)
     for task in assignments_collected:
-        key = build_task_key(task)
-        if key in existing_keys:
-            existing_task = task_lookup.get(key)
-            if isinstance(existing_task, dict):
-                for field, value in task.items():
-                    if field in preserved_fields:
-                        continue
-                    existing_task[field] = value
-            continue
-        existing_tasks.append(task)
-        existing_keys.add(key)
-        task_lookup[key] = task
-        new_tasks_added += 1
-
-    write_tasks(tasks_path, backup_path, original_text, existing_tasks)
+        task_index.upsert(task)
+    changes = task_index.changes
+    new_tasks_added = len(changes["added"])
+
+    if not write_tasks(tasks_path, backup_path, original_text, existing_tasks):
+        print(f"No task changes; left {tasks_path.name} untouched.")
+    # Build the dashboard's binary task cache here so its reload after a sync
+    # reads that instead of parsing JSON and writing the cache on a request.
+    try:
+        refresh_task_cache(tasks_path)
+    except (SystemExit, KeyError, TypeError, ValueError) as exc:
+        print(f"Could not refresh the task cache for {tasks_path.name}: {exc}")
+    write_json_if_changed(
+        changes_path,
+        {"added": changes["added"], "updated": changes["updated"], "unchanged": len(changes["unchanged"])},
+    )
     document_total = sum(document_counts.values())
     simplified_courses = simplify_courses(filtered_courses)
     write_courses(courses_path, simplified_courses)
+    state.save()
+    if _response_cache is not None:
+        _response_cache.save()
 
     print(
         f"Fetched {len(filtered_courses)} courses, "
         f"{total_assignments} assignments, "
-        f"added {new_tasks_added} new tasks within {LOOKAHEAD_DAYS} days. "
+        f"added {new_tasks_added} new and updated {len(changes['updated'])} tasks within {LOOKAHEAD_DAYS} days "
+        f"({len(changes['unchanged'])} unchanged). "
         f"Cataloged {document_total} documents across {len(document_counts)} courses. "
         f"Saved {len(simplified_courses)} current courses."
     )
 
 
+def run_daemon(config: Dict[str, object], state: SyncState, home_dir: Path) -> None:
+    """Sync on a jittered interval until SIGTERM/SIGINT; SIGUSR1 triggers a sync now.
+
+    Connections in the shared pool, the sync state and the response cache stay
+    in memory between runs. A failed run is reported and retried on the next
+    tick instead of ending the daemon.
+    """
+    interval = cast(float, config["sync_interval_seconds"])
+    jitter = cast(float, config["sync_jitter_seconds"])
+    wake = threading.Event()
+    stopping = threading.Event()
+
+    def request_sync(signum: int, frame: object) -> None:
+        wake.set()
+
+    def request_stop(signum: int, frame: object) -> None:
+        stopping.set()
+        wake.set()
+
+    signal.signal(signal.SIGUSR1, request_sync)
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+    print(f"canvas_sync daemon started (pid {os.getpid()}); syncing every {interval / 60:g} minutes.")
+
+    while not stopping.is_set():
+        wake.clear()
+        try:
+            sync_once(config, state, home_dir)
+        except SystemExit:
+            print("Sync failed; retrying at the next interval.")
+        except Exception:
+            # An unexpected bug or I/O error in one run must not end the daemon.
+            traceback.print_exc()
+            print("Sync failed unexpectedly; retrying at the next interval.")
+        if stopping.is_set():
+            break
+        delay = max(1.0, interval + random.uniform(-jitter, jitter))
+        print(f"Next sync in {delay / 60:.1f} minutes.")
+        wake.wait(delay)
+    print("canvas_sync daemon stopped.")
+
+
+def main(argv: List[str] | None = None) -> None:
+    args = parse_args(argv)
+    home_dir = Path.home()
+    config = load_config(home_dir / "canvas_config.json")
+    state = SyncState.load(home_dir / "canvas_sync_state.json", full=args.full)
+    _rate_limiter.configure(cast(int, config["max_concurrency"]))
+    configure_response_cache(
+        cast(Dict[str, object], config["response_cache"]),
+        enabled=args.cache or args.offline,
+        offline=args.offline,
+    )
+
+    if args.daemon:
+        sys.stdout.reconfigure(line_buffering=True)  # type: ignore[union-attr]
+        run_daemon(config, state, home_dir)
+    else:
+        sync_once(config, state, home_dir)
+
+
 if __name__ == "__main__":
     main()
@@ -5,8 +5,15 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Dict, Iterable, List
-from urllib import error, parse, request
+import threading
+import time
+from typing import Dict, Iterable, List, Tuple
+from urllib import error, parse
+
+from canvas_http import canvas_get, map_ordered, numbered_page_urls, parse_link_header
+
+COURSE_CACHE_TTL_SECONDS = float(os.environ.get("CANVAS_COURSES_TTL", "300"))
+COURSE_CACHE_ERROR_TTL_SECONDS = float(os.environ.get("CANVAS_COURSES_ERROR_TTL", "30"))
 
 
 def _get_env(name: str) -> str:
@@ -16,43 +23,38 @@ def _get_env(name: str) -> str:
     return value
 
 
-def _parse_next_link(link_header: str | None) -> str | None:
-    if not link_header:
-        return None
-    for part in link_header.split(","):
-        section = part.strip()
-        if 'rel="next"' not in section:
-            continue
-        start = section.find("<")
-        end = section.find(">", start + 1)
-        if start == -1 or end == -1:
-            continue
-        return section[start + 1 : end]
-    return None
+def _fetch_page(url: str, headers: Dict[str, str]) -> Tuple[List[Dict[str, object]], Dict[str, str]]:
+    try:
+        body, page_headers = canvas_get(url, headers)
+        payload = body.decode("utf-8")
+    except error.HTTPError as exc:
+        raise RuntimeError(f"Canvas request failed: {exc}") from exc
+    except error.URLError as exc:
+        raise RuntimeError(f"Network error while contacting Canvas: {exc}") from exc
+
+    try:
+        page_data = json.loads(payload)
+    except json.JSONDecodeError as exc:
+        raise RuntimeError(f"Invalid JSON from Canvas: {exc}") from exc
+    if not isinstance(page_data, list):
+        raise RuntimeError("Canvas response is not a list.")
+    return page_data, parse_link_header(page_headers.get("Link"))
 
 
 def _fetch_paginated(url: str, headers: Dict[str, str], params: Dict[str, Iterable[str] | str]) -> List[Dict[str, object]]:
-    next_url = f"{url}?{parse.urlencode(params, doseq=True)}"
-    collected: List[Dict[str, object]] = []
-    while next_url:
-        req = request.Request(next_url, headers=headers)
-        try:
-            with request.urlopen(req, timeout=30) as resp:
-                payload = resp.read().decode("utf-8")
-                page_headers = dict(resp.headers.items())
-        except error.HTTPError as exc:
-            raise RuntimeError(f"Canvas request failed: {exc}") from exc
-        except error.URLError as exc:
-            raise RuntimeError(f"Network error while contacting Canvas: {exc}") from exc
+    collected, links = _fetch_page(f"{url}?{parse.urlencode(params, doseq=True)}", headers)
+    next_url = links.get("next")
+    # Numbered pages can all be requested at once; bookmarks must be followed.
+    page_urls = numbered_page_urls(next_url, links["last"]) if next_url and "last" in links else None
+    if page_urls is not None:
+        for page_data, _ in map_ordered(lambda page_url: _fetch_page(page_url, headers), page_urls):
+            collected.extend(page_data)
+        return collected
 
-        try:
-            page_data = json.loads(payload)
-        except json.JSONDecodeError as exc:
-            raise RuntimeError(f"Invalid JSON from Canvas: {exc}") from exc
-        if not isinstance(page_data, list):
-            raise RuntimeError("Canvas response is not a list.")
+    while next_url:
+        page_data, links = _fetch_page(next_url, headers)
         collected.extend(page_data)
-        next_url = _parse_next_link(page_headers.get("Link"))
+        next_url = links.get("next")
     return collected
 
 
@@ -87,4 +89,99 @@ def get_active_courses() -> List[Dict[str, str]]:
     return simplified
 
 
-__all__ = ["get_active_courses"]
+class _CourseListCache:
+    """Per-account course list with TTL expiry and stale-while-revalidate refreshes."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, str], Tuple[List[Dict[str, str]], float]] = {}
+        self._refreshing: set[Tuple[str, str]] = set()
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "errors": 0}
+        self.last_error = ""
+
+    def get(self, ttl: float, error_ttl: float) -> List[Dict[str, str]]:
+        key = (_get_env("CANVAS_BASE_URL").rstrip("/"), _get_env("CANVAS_TOKEN"))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                courses, expires_at = entry
+                if now < expires_at:
+                    self._stats["hits"] += 1
+                    return list(courses)
+                self._stats["stale_hits"] += 1
+                if key not in self._refreshing:
+                    self._refreshing.add(key)
+                    try:
+                        threading.Thread(
+                            target=self._refresh, args=(key, ttl, error_ttl), daemon=True
+                        ).start()
+                    except RuntimeError as exc:
+                        # Could not start a thread; let a later call try again.
+                        self._refreshing.discard(key)
+                        self._stats["errors"] += 1
+                        self.last_error = str(exc)
+                return list(courses)
+            self._stats["misses"] += 1
+
+        # Cold miss: nothing to serve yet, so fetch in the caller's thread.
+        try:
+            courses = get_active_courses()
+        except Exception as exc:
+            with self._lock:
+                self._stats["errors"] += 1
+                self.last_error = str(exc)
+                # Cache the failure briefly so an outage does not stall every render.
+                self._entries.setdefault(key, ([], time.monotonic() + error_ttl))
+            raise
+        with self._lock:
+            self._entries[key] = (courses, time.monotonic() + ttl)
+        return list(courses)
+
+    def _refresh(self, key: Tuple[str, str], ttl: float, error_ttl: float) -> None:
+        try:
+            courses = get_active_courses()
+        except Exception as exc:
+            # Anything from an odd payload counts as a failed refresh, so the
+            # stale list is kept and retried after ``error_ttl``.
+            with self._lock:
+                self._stats["errors"] += 1
+                self.last_error = str(exc)
+                stale, _ = self._entries.get(key, ([], 0.0))
+                self._entries[key] = (stale, time.monotonic() + error_ttl)
+                self._refreshing.discard(key)
+            return
+        # The flag is cleared together with the new entry, so no caller can see
+        # the expired entry with no refresh in flight and start another one.
+        with self._lock:
+            self._stats["refreshes"] += 1
+            self._entries[key] = (courses, time.monotonic() + ttl)
+            self._refreshing.discard(key)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+
+_course_cache = _CourseListCache()
+
+
+def get_active_courses_cached(
+    ttl: float = COURSE_CACHE_TTL_SECONDS,
+    error_ttl: float = COURSE_CACHE_ERROR_TTL_SECONDS,
+) -> List[Dict[str, str]]:
+    """Return active courses from memory, refreshing expired entries in the background.
+
+    Only the very first call per account blocks on Canvas. Afterwards an expired
+    list is served immediately while a single background thread refreshes it; a
+    failed fetch keeps the previous list and is retried after ``error_ttl``.
+    """
+    return _course_cache.get(ttl, error_ttl)
+
+
+def course_cache_stats() -> Dict[str, int]:
+    """Return hit/miss/refresh counters for the active course cache."""
+    return _course_cache.stats()
+
+
+__all__ = ["course_cache_stats", "get_active_courses", "get_active_courses_cached"]
@@ -4,18 +4,201 @@
 from __future__ import annotations
 
 import json
-from datetime import date, datetime, time
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Sequence, Tuple
 from zoneinfo import ZoneInfo
 
+try:
+    import numpy as np
+except ImportError:  # optional: only used for very large task lists
+    np = None
+
 TIMEZONE = ZoneInfo("Europe/Stockholm")
 TASKS_FILE = Path(__file__).with_name("tasks.json")
 
 GROUP_TITLES = ("TODAY", "THIS WEEK", "LATER")
+# Below this many tasks the bisect grouping is faster than building arrays.
+VECTORIZED_MIN_TASKS = 20_000
+
+# Columnar task cache written next to the JSON file (see refresh_task_cache).
+TASK_CACHE_SUFFIX = ".bin"
+_TASK_CACHE_MAGIC = b"TSKC"
+_TASK_CACHE_VERSION = 1
+# magic (4s), format version (H), byte order (c), one pad byte (x) so the
+# int64s start 8-byte aligned, source mtime_ns (q), source size (q), tasks (I),
+# strings (I), blob bytes (I) and a reserved uint32 that is always written as 0.
+_TASK_CACHE_HEADER = struct.Struct("=4sHcxqqIIII")
+_TASK_CACHE_COLUMNS = ("title", "course", "type", "due_time")
+_LOCAL_EPOCH = datetime(1970, 1, 1, tzinfo=TIMEZONE)
+_UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+@lru_cache(maxsize=8192)
+def parse_iso_date(value: str) -> date:
+    """Parse ``YYYY-MM-DD`` like ``strptime(value, "%Y-%m-%d")``, minus the locale machinery.
+
+    Canonical strings are sliced directly; anything else (e.g. unpadded
+    months) goes through ``strptime`` so accepted input and errors match.
+    Results are memoized because task files repeat the same dates a lot.
+    """
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        year, month, day = value[:4], value[5:7], value[8:]
+        if year.isdigit() and month.isdigit() and day.isdigit():
+            return date(int(year), int(month), int(day))
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+@lru_cache(maxsize=2048)
+def parse_hhmm(value: str) -> time:
+    """Parse ``HH:MM`` like ``strptime(value, "%H:%M").time()``, with the same fallback."""
+    if len(value) == 5 and value[2] == ":":
+        hour, minute = value[:2], value[3:]
+        if hour.isdigit() and minute.isdigit():
+            return time(int(hour), int(minute))
+    return datetime.strptime(value, "%H:%M").time()
+
+
+def task_cache_path(path: Path) -> Path:
+    return path.with_name(path.name + TASK_CACHE_SUFFIX)
+
+
+def _write_task_cache(cache_path: Path, source: os.stat_result, tasks: List[Dict[str, object]]) -> None:
+    """Write tasks as fixed-width columns plus an interned string table.
+
+    Due times are stored as local wall-clock seconds since 1970-01-01 so they
+    round-trip exactly, including across DST gaps. The cache is best effort:
+    any task with non-string fields, or any write error, just skips it.
+    """
+    strings: List[str] = []
+    string_ids: Dict[str, int] = {}
+    columns = {name: array("I") for name in _TASK_CACHE_COLUMNS}
+    due_seconds = array("q")
+    for task in tasks:
+        for name in _TASK_CACHE_COLUMNS:
+            value = task[name]
+            if not isinstance(value, str):
+                return
+            string_id = string_ids.get(value)
+            if string_id is None:
+                string_id = string_ids[value] = len(strings)
+                strings.append(value)
+            columns[name].append(string_id)
+        due_dt: datetime = task["due_datetime"]  # type: ignore[assignment]
+        if due_dt.tzinfo is not TIMEZONE:
+            return
+        # Same tzinfo on both sides, so this is a wall-clock difference.
+        due_seconds.append((due_dt - _LOCAL_EPOCH) // timedelta(seconds=1))
 
+    encoded = [value.encode("utf-8") for value in strings]
+    offsets = array("I", [0])
+    for chunk in encoded:
+        offsets.append(offsets[-1] + len(chunk))
+    blob = b"".join(encoded)
+    header = _TASK_CACHE_HEADER.pack(
+        _TASK_CACHE_MAGIC,
+        _TASK_CACHE_VERSION,
+        b"<" if sys.byteorder == "little" else b">",
+        source.st_mtime_ns,
+        source.st_size,
+        len(tasks),
+        len(strings),
+        len(blob),
+        0,  # reserved
+    )
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("wb") as handle:
+            handle.write(header)
+            handle.write(due_seconds.tobytes())
+            for name in _TASK_CACHE_COLUMNS:
+                handle.write(columns[name].tobytes())
+            handle.write(offsets.tobytes())
+            handle.write(blob)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def _read_task_cache(cache_path: Path, source: os.stat_result) -> List[Dict[str, object]] | None:
+    """Return the cached tasks, or None when the cache is missing, foreign or stale."""
+    try:
+        with cache_path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if len(data) < _TASK_CACHE_HEADER.size:
+                return None
+            magic, version, byte_order, mtime_ns, size, count, string_count, blob_size, _ = (
+                _TASK_CACHE_HEADER.unpack_from(data)
+            )
+            expected_order = b"<" if sys.byteorder == "little" else b">"
+            if (
+                magic != _TASK_CACHE_MAGIC
+                or version != _TASK_CACHE_VERSION
+                or byte_order != expected_order
+                or mtime_ns != source.st_mtime_ns
+                or size != source.st_size
+            ):
+                return None
+            offset = _TASK_CACHE_HEADER.size
+            expected_size = offset + count * 8 + count * 4 * len(_TASK_CACHE_COLUMNS) + (string_count + 1) * 4 + blob_size
+            if len(data) != expected_size:
+                return None
+            due_seconds = array("q")
+            due_seconds.frombytes(data[offset : offset + count * 8])
+            offset += count * 8
+            columns: Dict[str, array] = {}
+            for name in _TASK_CACHE_COLUMNS:
+                column = array("I")
+                column.frombytes(data[offset : offset + count * 4])
+                columns[name] = column
+                offset += count * 4
+            offsets = array("I")
+            offsets.frombytes(data[offset : offset + (string_count + 1) * 4])
+            offset += (string_count + 1) * 4
+            blob = data[offset : offset + blob_size]
+    except (OSError, ValueError):
+        return None
+
+    try:
+        strings = [blob[offsets[i] : offsets[i + 1]].decode("utf-8") for i in range(string_count)]
+    except UnicodeDecodeError:
+        return None
+    titles, courses, types, due_times = ([strings[i] for i in columns[name]] for name in _TASK_CACHE_COLUMNS)
+    # Task lists repeat due times a lot, so each distinct one becomes a datetime once.
+    due_datetimes = {seconds: _LOCAL_EPOCH + timedelta(seconds=seconds) for seconds in set(due_seconds)}
+    return [
+        {"title": title, "course": course, "type": task_type, "due_time": due_time, "due_datetime": due_datetimes[seconds]}
+        for title, course, task_type, due_time, seconds in zip(titles, courses, types, due_times, due_seconds)
+    ]
+
+
+def load_tasks(path: Path, *, use_cache: bool = True) -> List[Dict[str, object]]:
+    """Parse tasks from ``path``.
+
+    With ``use_cache`` the columnar cache next to the file is used when it
+    matches the file's mtime and size. Loading never writes the cache (the
+    dashboard reloads on request threads); ``refresh_task_cache`` does.
+    """
+    if use_cache:
+        try:
+            source = path.stat()
+        except OSError:
+            pass
+        else:
+            cached = _read_task_cache(task_cache_path(path), source)
+            if cached is not None:
+                return cached
 
-def load_tasks(path: Path) -> List[Dict[str, object]]:
     try:
         data = json.loads(path.read_text(encoding="utf-8"))
     except FileNotFoundError as exc:
@@ -26,12 +209,12 @@ def load_tasks(path: Path) -> List[Dict[str, object]]:
     parsed_tasks: List[Dict[str, object]] = []
     for raw in data:
         try:
-            due_date = datetime.strptime(raw["due_date"], "%Y-%m-%d").date()
+            due_date = parse_iso_date(raw["due_date"])
         except KeyError as exc:
             raise SystemExit(f"Missing due_date in task: {raw}") from exc
         due_time_str = raw.get("due_time") or ""
         if due_time_str:
-            due_time = datetime.strptime(due_time_str, "%H:%M").time()
+            due_time = parse_hhmm(due_time_str)
         else:
             due_time = time(hour=23, minute=59)
 
@@ -48,6 +231,73 @@ def load_tasks(path: Path) -> List[Dict[str, object]]:
     return parsed_tasks
 
 
+def refresh_task_cache(path: Path) -> None:
+    """Rebuild the columnar cache for ``path`` unless it is already current.
+
+    Meant for whoever writes the task file (``canvas_sync``), right after
+    writing it. A file that changes while it is being parsed is left
+    uncached rather than cached under the wrong mtime.
+    """
+    try:
+        source = path.stat()
+    except OSError:
+        return
+    cache_path = task_cache_path(path)
+    if _read_task_cache(cache_path, source) is not None:
+        return
+    tasks = load_tasks(path, use_cache=False)
+    try:
+        current = path.stat()
+    except OSError:
+        return
+    if (current.st_mtime_ns, current.st_size) == (source.st_mtime_ns, source.st_size):
+        _write_task_cache(cache_path, source, tasks)
+
+
+class TaskStore:
+    """Parsed tasks for one file, re-read only when the file changes on disk.
+
+    Changes are detected through the file's mtime, size and inode, so both
+    in-place edits and atomic replacements trigger a reload. Tasks are handed
+    out sorted by ``due_datetime``; ``version`` increases on every reload.
+    Callers that cache derived data should key it on ``snapshot()``, which
+    returns the version together with the tasks it belongs to.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.version = 0
+        self._lock = threading.Lock()
+        self._signature: Tuple[int, int, int] | None = None
+        self._tasks: Tuple[Dict[str, object], ...] = ()
+
+    def get(self) -> Tuple[Dict[str, object], ...]:
+        return self.snapshot()[1]
+
+    def snapshot(self) -> Tuple[int, Tuple[Dict[str, object], ...]]:
+        """Return ``(version, tasks)`` read under one lock, so the pair always matches."""
+        try:
+            stat = self.path.stat()
+            signature: Tuple[int, int, int] | None = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        except OSError:
+            signature = None
+        with self._lock:
+            if signature is not None and signature == self._signature:
+                return self.version, self._tasks
+            try:
+                tasks = load_tasks(self.path)
+            except SystemExit:
+                # Keep serving the last good parse (e.g. while a writer is mid-save).
+                if self._signature is None:
+                    raise
+                return self.version, self._tasks
+            tasks.sort(key=lambda task: task["due_datetime"])  # type: ignore[arg-type, return-value]
+            self._tasks = tuple(tasks)
+            self._signature = signature
+            self.version += 1
+            return self.version, self._tasks
+
+
 def group_task(due_dt: datetime, today: date) -> str:
     if due_dt.date() == today:
         return "TODAY"
@@ -59,6 +309,64 @@ def group_task(due_dt: datetime, today: date) -> str:
     return "LATER"
 
 
+def group_sorted_tasks(
+    tasks: Sequence[Dict[str, object]], today: date
+) -> Dict[str, List[Dict[str, object]]]:
+    """Split tasks already sorted by ``due_datetime`` into TODAY/THIS WEEK/LATER.
+
+    Matches ``group_task`` for every task, but the buckets are found with four
+    bisections on the due dates and copied out as slices, so each group keeps
+    the input's due order without being sorted again.
+    """
+    ordinals = [task["due_datetime"].date().toordinal() for task in tasks]  # type: ignore[attr-defined]
+    week_start = today - timedelta(days=today.weekday())
+    week_end = week_start + timedelta(days=6)
+    start_of_week = bisect_left(ordinals, week_start.toordinal())
+    start_of_today = bisect_left(ordinals, today.toordinal(), lo=start_of_week)
+    end_of_today = bisect_right(ordinals, today.toordinal(), lo=start_of_today)
+    end_of_week = bisect_right(ordinals, week_end.toordinal(), lo=end_of_today)
+    return {
+        "TODAY": list(tasks[start_of_today:end_of_today]),
+        "THIS WEEK": list(tasks[start_of_week:start_of_today]) + list(tasks[end_of_today:end_of_week]),
+        "LATER": list(tasks[:start_of_week]) + list(tasks[end_of_week:]),
+    }
+
+
+def group_tasks_vectorized(
+    tasks: Sequence[Dict[str, object]], today: date
+) -> Dict[str, List[Dict[str, object]]]:
+    """NumPy variant of sorting plus ``group_sorted_tasks`` for unsorted input.
+
+    Due datetimes share one tzinfo, so Python orders them by wall-clock time;
+    that wall time is packed into an int64 key once per task, ordered with a
+    stable ``argsort`` and bucketed as ``datetime64`` days against the day and
+    ISO-week bounds. Requires NumPy.
+    """
+    if np is None:
+        raise RuntimeError("NumPy is not installed")
+    wall_clock = np.fromiter(
+        (
+            (dt.toordinal() * 86_400 + dt.hour * 3_600 + dt.minute * 60 + dt.second) * 1_000_000 + dt.microsecond
+            for dt in (task["due_datetime"] for task in tasks)  # type: ignore[attr-defined]
+        ),
+        dtype="int64",
+        count=len(tasks),
+    )
+    order = np.argsort(wall_clock, kind="stable")
+    days = (wall_clock[order] // 86_400_000_000 - _UNIX_EPOCH_ORDINAL).astype("datetime64[D]")
+
+    today_day = np.datetime64(today, "D")
+    week_start = today_day - today.weekday()
+    in_today = days == today_day
+    in_week = (days >= week_start) & (days <= week_start + 6) & ~in_today
+    later = ~(in_today | in_week)
+    return {
+        "TODAY": [tasks[index] for index in order[in_today].tolist()],
+        "THIS WEEK": [tasks[index] for index in order[in_week].tolist()],
+        "LATER": [tasks[index] for index in order[later].tolist()],
+    }
+
+
 def format_due_display(task: Dict[str, object], today: date) -> str:
     due_dt: datetime = task["due_datetime"]  # type: ignore[assignment]
     due_time_str = task["due_time"]
@@ -85,13 +393,11 @@ def main() -> None:
     tasks = load_tasks(TASKS_FILE)
     today = datetime.now(TIMEZONE).date()
 
-    grouped: Dict[str, List[Dict[str, object]]] = {title: [] for title in GROUP_TITLES}
-    for task in tasks:
-        grouping = group_task(task["due_datetime"], today)  # type: ignore[arg-type]
-        grouped[grouping].append(task)
-
-    for task_list in grouped.values():
-        task_list.sort(key=lambda t: t["due_datetime"])  # type: ignore[arg-type]
+    if np is not None and len(tasks) >= VECTORIZED_MIN_TASKS:
+        grouped = group_tasks_vectorized(tasks, today)
+    else:
+        tasks.sort(key=lambda t: t["due_datetime"])  # type: ignore[arg-type, return-value]
+        grouped = group_sorted_tasks(tasks, today)
 
     for title in GROUP_TITLES:
         print_group(title, grouped[title], today)
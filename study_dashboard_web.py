@@ -3,28 +3,36 @@
 
 from __future__ import annotations
 
+import calendar
+import gzip
+import hashlib
+import heapq
 import json
 import os
 import re
-import calendar
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass, fields
 from datetime import date, datetime, time, timedelta
-from itertools import groupby
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Generic, List, Sequence, Tuple, TypeVar
 
 import requests
-from flask import Flask, jsonify, render_template_string, request
+from flask import Flask, Response, jsonify, make_response, render_template, request
 from openai import OpenAI
 
 from study_dashboard import (
-    GROUP_TITLES,
     TASKS_FILE,
     TIMEZONE,
+    TaskStore,
     format_due_display,
-    group_task,
-    load_tasks,
+    group_sorted_tasks,
+    parse_hhmm,
+    parse_iso_date,
 )
-from courses_client import get_active_courses
+from courses_client import course_cache_stats, get_active_courses_cached
+from canvas_http import pool_stats
 
 app = Flask(__name__)
 client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
@@ -241,6 +249,13 @@ accounting_theory_schedule = [
     },
 ]
 
+PAGE_CACHE_SIZE = 32
+TASK_PAGE_SIZE = 10
+TASKS_API_MAX_LIMIT = 100
+SCHEDULE_JSON_CACHE_SIZE = 64
+MINI_CALENDAR_CACHE_SIZE = 24
+SCHEDULE_API_MAX_DAYS = 366
+
 SECTION_CONFIG: Tuple[Tuple[str, str, str], ...] = (
     ("TODAY", "Today", "#ffd5cc"),
     ("THIS WEEK", "This Week", "#ffe8b3"),
@@ -703,6 +718,22 @@ HTML_TEMPLATE = """
             color: var(--text-muted);
             font-size: 14px;
         }
+        .task-load-more {
+            margin-top: 16px;
+            width: 100%;
+            padding: 10px 14px;
+            border: 1px dashed #d6d8e8;
+            border-radius: 12px;
+            background: transparent;
+            color: var(--text-muted);
+            font-size: 13px;
+            font-weight: 600;
+            cursor: pointer;
+        }
+        .task-load-more:disabled {
+            cursor: progress;
+            opacity: 0.6;
+        }
         .highlight-task {
             background: linear-gradient(135deg, #fff5e8, #ffe8d7);
             border-radius: 16px;
@@ -1557,7 +1588,7 @@ HTML_TEMPLATE = """
                                     </div>
                                     {% if tasks|length > 1 %}
                                     <div class="task-list">
-                                        {% for task in tasks[1:] %}
+                                        {% for task in tasks[1:task_page_size] %}
                                         <div class="task-item">
                                             <p class="task-title">{{ task.title }}</p>
                                             <div class="task-badges">
@@ -1571,7 +1602,7 @@ HTML_TEMPLATE = """
                                     {% endif %}
                                 {% else %}
                                     <div class="task-list">
-                                        {% for task in tasks %}
+                                        {% for task in tasks[:task_page_size] %}
                                         <div class="task-item">
                                             <p class="task-title">{{ task.title }}</p>
                                             <div class="task-badges">
@@ -1583,6 +1614,14 @@ HTML_TEMPLATE = """
                                         {% endfor %}
                                     </div>
                                 {% endif %}
+                                {% if tasks|length > task_page_size %}
+                                <button
+                                    type="button"
+                                    class="task-load-more"
+                                    data-task-group="{{ key }}"
+                                    data-task-cursor="{{ task_cursors[key] }}"
+                                >Show {{ tasks|length - task_page_size }} more</button>
+                                {% endif %}
                             {% endif %}
                         </div>
                     </section>
@@ -1824,25 +1863,37 @@ HTML_TEMPLATE = """
     </div>
     <script>
         document.addEventListener("DOMContentLoaded", function () {
-            var scheduleEvents = {{ calendar_events_data|tojson }};
             var eventsByDate = {};
-            scheduleEvents.forEach(function (event) {
-                if (!eventsByDate[event.date]) {
-                    eventsByDate[event.date] = [];
-                }
-                eventsByDate[event.date].push(event);
-            });
-            Object.keys(eventsByDate).forEach(function (dateKey) {
-                eventsByDate[dateKey].sort(function (a, b) {
-                    var aKey = a.start_time || a.time_display || "";
-                    var bKey = b.start_time || b.time_display || "";
-                    return aKey.localeCompare(bKey);
+            var loadedMonths = {};
+
+            function addScheduleEvents(events) {
+                var touched = {};
+                events.forEach(function (event) {
+                    if (!eventsByDate[event.date]) {
+                        eventsByDate[event.date] = [];
+                    }
+                    eventsByDate[event.date].push(event);
+                    touched[event.date] = true;
                 });
-            });
+                Object.keys(touched).forEach(function (dateKey) {
+                    eventsByDate[dateKey].sort(function (a, b) {
+                        var aKey = a.start_time || a.time_display || "";
+                        var bKey = b.start_time || b.time_display || "";
+                        return aKey.localeCompare(bKey);
+                    });
+                });
+            }
 
             var todayIso = "{{ today_iso }}";
             var initialYear = {{ mini_calendar.year }};
             var initialMonth = {{ mini_calendar.month }};
+            // Only the initial month is inlined; other months come from /api/schedule.
+            addScheduleEvents({{ calendar_events_data|tojson }});
+            loadedMonths[monthPrefix(initialYear, initialMonth)] = true;
+            // Mini calendar month grids are precomputed server-side and fetched per month.
+            var miniGrids = {};
+            var pendingMiniGrids = {};
+            miniGrids[monthPrefix(initialYear, initialMonth)] = {{ mini_calendar|tojson }};
             var overlay = document.getElementById("calendar-overlay");
             var miniGrid = document.getElementById("mini-calendar-grid");
             var miniTitle = document.getElementById("mini-calendar-title");
@@ -1878,12 +1929,106 @@ HTML_TEMPLATE = """
                 return year + "-" + pad(month);
             }
 
+            function normalizeMonth(year, month) {
+                while (month < 1) {
+                    month += 12;
+                    year -= 1;
+                }
+                while (month > 12) {
+                    month -= 12;
+                    year += 1;
+                }
+                return { year: year, month: month };
+            }
+
+            function loadMonth(year, month) {
+                var normalized = normalizeMonth(year, month);
+                var prefix = monthPrefix(normalized.year, normalized.month);
+                if (loadedMonths[prefix] === true) {
+                    return Promise.resolve();
+                }
+                if (loadedMonths[prefix]) {
+                    return loadedMonths[prefix];
+                }
+                var lastDay = new Date(normalized.year, normalized.month, 0).getDate();
+                var params = new URLSearchParams({
+                    start: prefix + "-01",
+                    end: prefix + "-" + pad(lastDay),
+                });
+                var pending = fetch("/api/schedule?" + params.toString())
+                    .then(function (response) {
+                        if (!response.ok) {
+                            throw new Error("Unable to load schedule.");
+                        }
+                        return response.json();
+                    })
+                    .then(function (payload) {
+                        addScheduleEvents(payload.events || []);
+                        loadedMonths[prefix] = true;
+                    })
+                    .catch(function () {
+                        delete loadedMonths[prefix];
+                    });
+                loadedMonths[prefix] = pending;
+                return pending;
+            }
+
+            function loadMonthWithNeighbours(year, month) {
+                return Promise.all([
+                    loadMonth(year, month - 1),
+                    loadMonth(year, month),
+                    loadMonth(year, month + 1),
+                ]);
+            }
+
             function formatMonthYear(year, month) {
                 var formatter = new Intl.DateTimeFormat(undefined, { month: "long", year: "numeric" });
                 return formatter.format(new Date(year, month - 1, 1));
             }
 
+            function loadMiniGrid(year, month) {
+                var prefix = monthPrefix(year, month);
+                if (miniGrids[prefix] || pendingMiniGrids[prefix]) {
+                    return;
+                }
+                pendingMiniGrids[prefix] = fetch("/api/mini-calendar/" + prefix)
+                    .then(function (response) {
+                        if (!response.ok) {
+                            throw new Error("Unable to load month.");
+                        }
+                        return response.json();
+                    })
+                    .then(function (grid) {
+                        miniGrids[prefix] = grid;
+                        if (monthPrefix(calendarState.currentYear, calendarState.currentMonth) === prefix) {
+                            renderMiniCalendar();
+                        }
+                    })
+                    .catch(function () {})
+                    .then(function () {
+                        delete pendingMiniGrids[prefix];
+                    });
+            }
+
             function buildMiniCells(year, month) {
+                var grid = miniGrids[monthPrefix(year, month)];
+                if (grid) {
+                    return grid.days.map(function (day) {
+                        if (!day.is_current_month) {
+                            return { placeholder: true };
+                        }
+                        return {
+                            placeholder: false,
+                            iso: day.date_iso,
+                            dayNumber: day.day_number,
+                            year: year,
+                            month: month,
+                            events: day.events,
+                            isToday: day.is_today,
+                        };
+                    });
+                }
+                loadMiniGrid(year, month);
                 var firstDay = new Date(year, month - 1, 1);
                 var startWeekday = (firstDay.getDay() + 6) % 7;
                 var daysInMonth = new Date(year, month, 0).getDate();
@@ -1899,7 +2044,7 @@ HTML_TEMPLATE = """
                         dayNumber: day,
                         year: year,
                         month: month,
-                        events: eventsByDate[iso] || [],
+                        events: [],
                         isToday: iso === todayIso,
                     });
                 }
@@ -1987,7 +2132,9 @@ HTML_TEMPLATE = """
                     var meta = document.createElement("span");
                     meta.className = "mini-tooltip-meta";
                     var timeLabel = "";
-                    if (eventItem.start_time && eventItem.end_time) {
+                    if (eventItem.time) {
+                        timeLabel = eventItem.time;
+                    } else if (eventItem.start_time && eventItem.end_time) {
                         timeLabel = eventItem.start_time + "–" + eventItem.end_time;
                     } else if (eventItem.start_time) {
                         timeLabel = eventItem.start_time;
@@ -2189,6 +2336,7 @@ HTML_TEMPLATE = """
                         renderMiniCalendar();
                         renderFullCalendar();
                         renderEventList();
+                        refreshMonthData(false);
                     });
                     calendarGrid.appendChild(button);
                 });
@@ -2219,6 +2367,23 @@ HTML_TEMPLATE = """
                 if (opts.scroll !== false) {
                     scrollSelectedCellIntoView();
                 }
+                refreshMonthData(!!opts.forceSelection);
+            }
+
+            function refreshMonthData(forceSelection) {
+                var year = calendarState.currentYear;
+                var month = calendarState.currentMonth;
+                loadMonthWithNeighbours(year, month).then(function () {
+                    if (calendarState.currentYear !== year || calendarState.currentMonth !== month) {
+                        return;
+                    }
+                    ensureSelectedDateForMonth(forceSelection);
+                    renderMiniCalendar();
+                    if (overlay && overlay.classList.contains("open")) {
+                        renderFullCalendar();
+                        renderEventList();
+                    }
+                });
             }
 
             function closeOverlay() {
@@ -2231,24 +2396,16 @@ HTML_TEMPLATE = """
             }
 
             function changeMonth(offset, forceSelection) {
-                var newMonth = calendarState.currentMonth + offset;
-                var newYear = calendarState.currentYear;
-                while (newMonth < 1) {
-                    newMonth += 12;
-                    newYear -= 1;
-                }
-                while (newMonth > 12) {
-                    newMonth -= 12;
-                    newYear += 1;
-                }
-                calendarState.currentMonth = newMonth;
-                calendarState.currentYear = newYear;
+                var target = normalizeMonth(calendarState.currentYear, calendarState.currentMonth + offset);
+                calendarState.currentMonth = target.month;
+                calendarState.currentYear = target.year;
                 ensureSelectedDateForMonth(!!forceSelection);
                 renderMiniCalendar();
                 if (overlay && overlay.classList.contains("open")) {
                     renderFullCalendar();
                     renderEventList();
                 }
+                refreshMonthData(!!forceSelection);
             }
 
             renderMiniCalendar();
@@ -2366,9 +2523,75 @@ HTML_TEMPLATE = """
                     renderMiniCalendar();
                     renderFullCalendar();
                     renderEventList();
+                    refreshMonthData(false);
+                });
+            }
+
+            function titleCase(value) {
+                return value.toLowerCase().replace(/\b\w/g, function (letter) {
+                    return letter.toUpperCase();
                 });
             }
 
+            function createTaskItem(task) {
+                var item = document.createElement("div");
+                item.className = "task-item";
+                var title = document.createElement("p");
+                title.className = "task-title";
+                title.textContent = task.title;
+                var badges = document.createElement("div");
+                badges.className = "task-badges";
+                var coursePill = document.createElement("span");
+                coursePill.className = "pill course-pill";
+                coursePill.setAttribute("data-course", task.course);
+                coursePill.textContent = task.course;
+                var typePill = document.createElement("span");
+                typePill.className = "pill type-pill type-" + (task.type || "other").toLowerCase().replace(/ /g, "-");
+                typePill.textContent = titleCase(task.type || "Task");
+                badges.appendChild(coursePill);
+                badges.appendChild(typePill);
+                var meta = document.createElement("p");
+                meta.className = "task-meta";
+                meta.textContent = "Due " + task.due_nice;
+                item.appendChild(title);
+                item.appendChild(badges);
+                item.appendChild(meta);
+                return item;
+            }
+
+            document.querySelectorAll(".task-load-more").forEach(function (button) {
+                button.addEventListener("click", function () {
+                    var list = button.parentElement.querySelector(".task-list");
+                    var params = new URLSearchParams({
+                        group: button.getAttribute("data-task-group"),
+                        cursor: button.getAttribute("data-task-cursor"),
+                    });
+                    button.disabled = true;
+                    fetch("/api/tasks?" + params.toString())
+                        .then(function (response) {
+                            if (!response.ok) {
+                                throw new Error("Unable to load tasks.");
+                            }
+                            return response.json();
+                        })
+                        .then(function (payload) {
+                            (payload.tasks || []).forEach(function (task) {
+                                list.appendChild(createTaskItem(task));
+                            });
+                            if (payload.next_cursor) {
+                                button.setAttribute("data-task-cursor", payload.next_cursor);
+                                button.textContent = "Show " + payload.remaining + " more";
+                                button.disabled = false;
+                            } else {
+                                button.remove();
+                            }
+                        })
+                        .catch(function () {
+                            button.disabled = false;
+                        });
+                });
+            });
+
             var travelOriginId = "740021704"; // Skärmarbrink T-bana
             var travelDestId = "740007480"; // Ekonomikum, Uppsala
             var travelForm = document.getElementById("travel-form");
@@ -2587,27 +2810,81 @@ HTML_TEMPLATE = """
 
 """
 
+# Parsed and compiled once at import; each request only executes the template.
+DASHBOARD_TEMPLATE = app.jinja_env.from_string(HTML_TEMPLATE)
+
+
+_task_store = TaskStore(TASKS_FILE)
+_grouped_tasks_lock = threading.Lock()
+_grouped_tasks: Tuple[Tuple[int, date], Dict[str, List[Dict[str, object]]]] | None = None
+
+
 def build_grouped_tasks() -> Dict[str, List[Dict[str, object]]]:
-    """Load tasks and arrange them for the template."""
-    tasks = load_tasks(TASKS_FILE)
+    """Load tasks and arrange them for the template.
+
+    The grouping only changes at local midnight or when tasks.json changes, so
+    it is rebuilt only then and shared (read-only) between requests.
+    """
+    global _grouped_tasks
+    version, tasks = _task_store.snapshot()
     today = datetime.now(TIMEZONE).date()
+    cache_key = (version, today)
+    with _grouped_tasks_lock:
+        if _grouped_tasks is not None and _grouped_tasks[0] == cache_key:
+            return _grouped_tasks[1]
+
+    grouped: Dict[str, List[Dict[str, object]]] = {}
+    for group, group_tasks in group_sorted_tasks(tasks, today).items():
+        decorated: List[Dict[str, object]] = []
+        for task in group_tasks:
+            task_copy = dict(task)
+            due_dt: datetime = task["due_datetime"]  # type: ignore[assignment]
+            task_copy["due_display"] = format_due_display(task, today)
+            due_time_str = task.get("due_time")
+            if due_time_str:
+                task_copy["due_nice"] = due_dt.strftime("%A, %d %B %Y %H:%M")
+            else:
+                task_copy["due_nice"] = due_dt.strftime("%A, %d %B %Y")
+            decorated.append(task_copy)
+        grouped[group] = decorated
+    with _grouped_tasks_lock:
+        _grouped_tasks = (cache_key, grouped)
+    return grouped
 
-    grouped: Dict[str, List[Dict[str, object]]] = {title: [] for title in GROUP_TITLES}
-    for task in tasks:
-        group = group_task(task["due_datetime"], today)  # type: ignore[arg-type]
-        task_copy = dict(task)
-        due_dt: datetime = task["due_datetime"]  # type: ignore[assignment]
-        task_copy["due_display"] = format_due_display(task, today)
-        due_time_str = task.get("due_time")
-        if due_time_str:
-            task_copy["due_nice"] = due_dt.strftime("%A, %d %B %Y %H:%M")
-        else:
-            task_copy["due_nice"] = due_dt.strftime("%A, %d %B %Y")
-        grouped[group].append(task_copy)
 
-    for chunk in grouped.values():
-        chunk.sort(key=lambda t: t["due_datetime"])  # type: ignore[arg-type]
-    return grouped
+def _task_due(task: Dict[str, object]) -> datetime:
+    return task["due_datetime"]  # type: ignore[return-value]
+
+
+def encode_task_cursor(tasks: Sequence[Dict[str, object]], end: int) -> str:
+    """Cursor pointing just past ``tasks[end - 1]`` in a due-sorted list.
+
+    It holds the last due time plus how many tasks sharing that due time were
+    already returned, so it stays valid when unrelated tasks come and go.
+    """
+    last_due = _task_due(tasks[end - 1])
+    already_sent = end - bisect_left(tasks, last_due, key=_task_due)
+    return f"{last_due.isoformat()}~{already_sent}"
+
+
+def _decode_task_cursor(tasks: Sequence[Dict[str, object]], cursor: str) -> int:
+    due_text, _, skip_text = cursor.rpartition("~")
+    due = datetime.fromisoformat(due_text)
+    if due.tzinfo is None or not skip_text.isdigit():
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return bisect_left(tasks, due, key=_task_due) + int(skip_text)
+
+
+def _serialize_task(task: Dict[str, object]) -> Dict[str, object]:
+    return {
+        "title": task["title"],
+        "course": task["course"],
+        "type": task["type"],
+        "due_time": task["due_time"],
+        "due_datetime": _task_due(task).isoformat(),
+        "due_display": task["due_display"],
+        "due_nice": task["due_nice"],
+    }
 
 
 def load_courses() -> List[Dict[str, str]]:
@@ -2640,7 +2917,7 @@ def _parse_date_string(value: str | None) -> date | None:
     if not value:
         return None
     try:
-        return datetime.strptime(value, "%Y-%m-%d").date()
+        return parse_iso_date(value)
     except ValueError:
         return None
 
@@ -2963,7 +3240,7 @@ def _parse_time_string(value: str | None) -> time | None:
     if not value:
         return None
     try:
-        return datetime.strptime(value, "%H:%M").time()
+        return parse_hhmm(value)
     except ValueError:
         return None
 
@@ -2973,9 +3250,9 @@ def _combine_date_time(date_value: date, time_value: time | None) -> datetime:
     return datetime.combine(date_value, base_time, TIMEZONE)
 
 
-def _estimate_prep_text(event: Dict[str, object]) -> str:
-    kind_value = str(event.get("kind") or event.get("type") or "").lower()
-    course_label = event.get("course_short") or event.get("course")
+def _estimate_prep_text(event: ScheduleEvent) -> str:
+    kind_value = event.kind.lower()
+    course_label = event.course_short or event.course
     if "hand" in kind_value or "exam" in kind_value:
         return "Prep: finalize your submission materials and review the instructions."
     if "workshop" in kind_value:
@@ -2987,14 +3264,73 @@ def _estimate_prep_text(event: Dict[str, object]) -> str:
     return "Prep: check the agenda and make sure everything is ready."
 
 
+@dataclass(frozen=True, slots=True)
+class ScheduleEvent:
+    """One normalized course-schedule entry.
+
+    Display strings that follow from ``date`` and ``start_time`` are derived on
+    access instead of being stored on every event.
+    """
+
+    id: str
+    course: str
+    course_short: str
+    course_slug: str
+    title: str
+    type: str
+    type_badge_class: str
+    track: str | None
+    time_display: str
+    start_time: str
+    end_time: str
+    raw_time: str
+    location: str
+    details: str
+    teacher: str
+    date: date
+    start_dt: datetime
+    end_dt: datetime | None
+    has_time: bool
+
+    @property
+    def kind(self) -> str:
+        return self.type
+
+    @property
+    def date_iso(self) -> str:
+        return self.date.isoformat()
+
+    @property
+    def day(self) -> str:
+        return self.date.strftime("%d")
+
+    @property
+    def weekday(self) -> str:
+        return self.date.strftime("%a")
+
+    @property
+    def date_heading(self) -> str:
+        return f"{self.date.strftime('%d %b')} – {self.weekday}"
+
+    @property
+    def time_sort(self) -> str:
+        return self.start_time
+
+    def as_dict(self) -> Dict[str, object]:
+        data: Dict[str, object] = {field.name: getattr(self, field.name) for field in fields(self)}
+        for name in ("date_iso", "day", "weekday", "date_heading", "time_sort", "kind"):
+            data[name] = getattr(self, name)
+        return data
+
+
 def _normalize_course_schedule(
     entries: List[Dict[str, str]],
     *,
     course_name: str,
     course_short: str,
     course_slug: str,
-) -> List[Dict[str, object]]:
-    normalized: List[Dict[str, object]] = []
+) -> List[ScheduleEvent]:
+    normalized: List[ScheduleEvent] = []
     for index, entry in enumerate(entries):
         date_value = _parse_date_string(entry.get("date"))
         if not date_value:
@@ -3016,39 +3352,33 @@ def _normalize_course_schedule(
         end_dt = _combine_date_time(date_value, end_time_obj) if end_time_obj else None
         has_time = start_time_obj is not None
         normalized.append(
-            {
-                "id": event_id,
-                "course": course_name,
-                "course_short": course_short,
-                "course_slug": course_slug,
-                "title": title_value,
-                "type": type_label,
-                "type_badge_class": type_class,
-                "track": track,
-                "time_display": time_display or "Time TBA",
-                "start_time": start_time or "",
-                "end_time": end_time or "",
-                "raw_time": entry.get("time", "") or "",
-                "location": entry.get("location", ""),
-                "details": entry.get("details", ""),
-                "teacher": entry.get("teacher", ""),
-                "date": date_value,
-                "date_iso": date_value.isoformat(),
-                "start_dt": start_dt,
-                "end_dt": end_dt,
-                "has_time": has_time,
-                "day": date_value.strftime("%d"),
-                "weekday": date_value.strftime("%a"),
-                "date_heading": f"{date_value.strftime('%d %b')} – {date_value.strftime('%a')}",
-                "time_sort": start_time or "",
-                "kind": type_label,
-            }
+            ScheduleEvent(
+                id=event_id,
+                course=course_name,
+                course_short=course_short,
+                course_slug=course_slug,
+                title=title_value,
+                type=type_label,
+                type_badge_class=type_class,
+                track=track,
+                time_display=time_display or "Time TBA",
+                start_time=start_time or "",
+                end_time=end_time or "",
+                raw_time=entry.get("time", "") or "",
+                location=entry.get("location", ""),
+                details=entry.get("details", ""),
+                teacher=entry.get("teacher", ""),
+                date=date_value,
+                start_dt=start_dt,
+                end_dt=end_dt,
+                has_time=has_time,
+            )
         )
     return normalized
 
 
-def _build_all_courses_schedule() -> List[Dict[str, object]]:
-    events: List[Dict[str, object]] = []
+def _build_all_courses_schedule() -> List[ScheduleEvent]:
+    events: List[ScheduleEvent] = []
     events.extend(
         _normalize_course_schedule(
             scientific_methods_schedule,
@@ -3068,146 +3398,120 @@ def _build_all_courses_schedule() -> List[Dict[str, object]]:
     return events
 
 
-def get_sorted_schedule(events: List[Dict[str, object]]) -> List[Dict[str, object]]:
-    return sorted(events, key=lambda item: (item["date"], item["time_sort"]))
+def get_sorted_schedule(events: List[ScheduleEvent]) -> List[ScheduleEvent]:
+    return sorted(events, key=lambda item: (item.date, item.time_sort))
 
 
-def get_schedule_this_week(
-    events: List[Dict[str, object]], today: date
-) -> List[Dict[str, object]]:
-    end_date = today + timedelta(days=7)
-    return [
-        item for item in events if isinstance(item["date"], date) and today <= item["date"] <= end_date
-    ]
+class ScheduleIndex:
+    """Date-sorted events with a parallel array of ordinal days for range lookups."""
 
+    __slots__ = ("events", "version", "_ordinals")
 
-def get_upcoming_schedule(events: List[Dict[str, object]], today: date) -> List[Dict[str, object]]:
-    return [item for item in events if isinstance(item["date"], date) and item["date"] >= today]
+    def __init__(self, events: Sequence[ScheduleEvent], version: int = 0) -> None:
+        self.events: Tuple[ScheduleEvent, ...] = tuple(events)
+        self.version = version
+        self._ordinals: List[int] = [event.date.toordinal() for event in self.events]
 
+    def __len__(self) -> int:
+        return len(self.events)
 
-def group_schedule_by_date(events: List[Dict[str, object]]) -> List[Dict[str, object]]:
-    grouped: List[Dict[str, object]] = []
-    for label, items in groupby(events, key=lambda event: event["date_heading"]):
-        grouped.append({"label": label, "events": list(items)})
-    return grouped
+    def between(self, start: date, end: date) -> Tuple[ScheduleEvent, ...]:
+        """Events dated from ``start`` through ``end`` (inclusive)."""
+        low = bisect_left(self._ordinals, start.toordinal())
+        high = bisect_right(self._ordinals, end.toordinal(), lo=low)
+        return self.events[low:high]
 
+    def month(self, year: int, month: int) -> Tuple[ScheduleEvent, ...]:
+        _, total_days = calendar.monthrange(year, month)
+        return self.between(date(year, month, 1), date(year, month, total_days))
 
-def build_calendar_events_data(events: List[Dict[str, object]]) -> List[Dict[str, str]]:
-    calendar_items: List[Dict[str, str]] = []
-    for event in events:
-        event_date = event.get("date")
-        if not isinstance(event_date, date):
-            continue
-        start_time = str(event.get("start_time") or "") or ""
-        end_time = str(event.get("end_time") or "") or ""
-        calendar_items.append(
-            {
-                "id": str(event.get("id", "")),
-                "date": event_date.isoformat(),
-                "title": str(event.get("title") or ""),
-                "course": str(event.get("course") or ""),
-                "course_short": str(event.get("course_short") or ""),
-                "type": str(event.get("type") or ""),
-                "type_badge_class": str(event.get("type_badge_class") or "other"),
-                "time_display": str(event.get("time_display") or ""),
-                "start_time": start_time,
-                "end_time": end_time,
-                "location": str(event.get("location") or ""),
-            }
-        )
-    return calendar_items
 
+class _ScheduleStore:
+    """Normalized, sorted course schedule shared by every request.
 
-def build_upcoming_highlights(
-    events: List[Dict[str, object]], max_items: int = 5
-) -> List[Dict[str, object]]:
-    now = datetime.now(TIMEZONE)
-    future_events: List[Dict[str, object]] = [
-        event
-        for event in events
-        if isinstance(event.get("start_dt"), datetime) and event["start_dt"] >= now
-    ]
-    highlights: List[Dict[str, object]] = []
-    used_ids: set[str] = set()
+    The schedule sources are static for the life of the process, so the
+    normalization runs once and is only redone when a source list is replaced
+    or resized.
+    """
 
-    def add_event(event: Dict[str, object]) -> None:
-        event_id = str(event.get("id") or "")
-        if not event_id or event_id in used_ids:
-            return
-        event_copy = dict(event)
-        event_copy["prep_estimate"] = _estimate_prep_text(event_copy)
-        highlights.append(event_copy)
-        used_ids.add(event_id)
-
-    def kind_label(event: Dict[str, object]) -> str:
-        return str(event.get("kind") or event.get("type") or "").lower()
-
-    for event in future_events:
-        kind = kind_label(event)
-        if "hand" in kind or "exam" in kind:
-            add_event(event)
-            break
-
-    for event in future_events:
-        if len(highlights) >= max_items:
-            break
-        kind = kind_label(event)
-        if "workshop" in kind:
-            add_event(event)
-            break
-
-    lecture_courses: set[str] = set()
-    for event in future_events:
-        if len(highlights) >= max_items:
-            break
-        kind = kind_label(event)
-        if "lecture" not in kind:
-            continue
-        course_key = str(
-            event.get("course_short") or event.get("course") or event.get("course_slug") or ""
-        )
-        if not course_key or course_key in lecture_courses:
-            continue
-        add_event(event)
-        lecture_courses.add(course_key)
-
-    if len(highlights) < max_items:
-        for event in future_events:
-            if len(highlights) >= max_items:
-                break
-            if str(event.get("id") or "") in used_ids:
-                continue
-            add_event(event)
-
-    highlights.sort(key=lambda item: item.get("start_dt") or now)
-    return highlights[:max_items]
-
-
-def _format_event_display(event: Dict[str, object]) -> Dict[str, object]:
-    start_dt = event.get("start_dt")
-    end_dt = event.get("end_dt")
-    has_time = bool(event.get("has_time"))
-    if isinstance(start_dt, datetime) and has_time:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._source_key: Tuple[Tuple[int, int], ...] | None = None
+        self._index = ScheduleIndex(())
+
+    @staticmethod
+    def _current_source_key() -> Tuple[Tuple[int, int], ...]:
+        sources = (scientific_methods_schedule, accounting_theory_schedule)
+        return tuple((id(source), len(source)) for source in sources)
+
+    def get(self) -> ScheduleIndex:
+        source_key = self._current_source_key()
+        with self._lock:
+            if source_key != self._source_key:
+                self._index = ScheduleIndex(
+                    get_sorted_schedule(_build_all_courses_schedule()),
+                    version=self._index.version + 1,
+                )
+                self._source_key = source_key
+            return self._index
+
+
+_schedule_store = _ScheduleStore()
+
+
+def get_course_schedule() -> ScheduleIndex:
+    """Return the read-only, date-indexed schedule for all courses."""
+    return _schedule_store.get()
+
+
+def _calendar_event_data(event: ScheduleEvent) -> Dict[str, str]:
+    return {
+        "id": event.id,
+        "date": event.date_iso,
+        "title": event.title,
+        "course": event.course,
+        "course_short": event.course_short,
+        "type": event.type,
+        "type_badge_class": event.type_badge_class or "other",
+        "time_display": event.time_display,
+        "start_time": event.start_time,
+        "end_time": event.end_time,
+        "location": event.location or "",
+    }
+
+
+def build_calendar_events_data(events: Sequence[ScheduleEvent]) -> List[Dict[str, str]]:
+    return [_calendar_event_data(event) for event in events]
+
+
+def _append_to_date_group(grouped: List[Dict[str, object]], label: str, item: object) -> None:
+    if grouped and grouped[-1]["label"] == label:
+        grouped[-1]["events"].append(item)  # type: ignore[union-attr]
+    else:
+        grouped.append({"label": label, "events": [item]})
+
+
+def _format_event_display(event: ScheduleEvent) -> Dict[str, object]:
+    start_dt = event.start_dt
+    end_dt = event.end_dt
+    has_time = event.has_time
+    if has_time:
         time_label = start_dt.strftime("%H:%M")
-        if isinstance(end_dt, datetime):
+        if end_dt is not None:
             time_label = f"{time_label} – {end_dt.strftime('%H:%M')}"
     else:
-        time_label = str(event.get("time_display") or "Time TBA")
-    day_label = ""
-    weekday_short = ""
-    full_day = ""
-    if isinstance(start_dt, datetime):
-        day_label = start_dt.strftime("%d")
-        weekday_short = start_dt.strftime("%a")
-        full_day = start_dt.strftime("%A, %d %B %Y")
+        time_label = event.time_display or "Time TBA"
+    day_label = start_dt.strftime("%d")
+    weekday_short = start_dt.strftime("%a")
+    full_day = start_dt.strftime("%A, %d %B %Y")
     display = {
-        "id": event.get("id"),
-        "title": event.get("title"),
-        "course": event.get("course"),
-        "course_short": event.get("course_short") or event.get("course"),
-        "kind": event.get("kind") or event.get("type"),
-        "kind_badge_class": event.get("type_badge_class") or "other",
-        "location": event.get("location") or "",
+        "id": event.id,
+        "title": event.title,
+        "course": event.course,
+        "course_short": event.course_short or event.course,
+        "kind": event.kind,
+        "kind_badge_class": event.type_badge_class or "other",
+        "location": event.location or "",
         "time_label": time_label,
         "prep_estimate": _estimate_prep_text(event),
         "has_time": has_time,
@@ -3220,56 +3524,6 @@ def _format_event_display(event: Dict[str, object]) -> Dict[str, object]:
     return display
 
 
-def _group_future_events_by_date(
-    events: List[Dict[str, object]], today: date, *, max_days: int | None = None
-) -> List[Dict[str, object]]:
-    grouped: List[Dict[str, object]] = []
-    day_lookup: Dict[str, Dict[str, object]] = {}
-    for event in events:
-        start_dt = event.get("start_dt")
-        if not isinstance(start_dt, datetime):
-            continue
-        event_date = start_dt.date()
-        if event_date < today:
-            continue
-        date_key = event_date.isoformat()
-        if date_key not in day_lookup:
-            if max_days is not None and len(grouped) >= max_days:
-                break
-            day_info = {
-                "date": event_date,
-                "date_iso": date_key,
-                "day_label": event_date.strftime("%d"),
-                "weekday": event_date.strftime("%a"),
-                "full_label": event_date.strftime("%A, %d %B %Y"),
-                "events": [],
-            }
-            grouped.append(day_info)
-            day_lookup[date_key] = day_info
-        day_lookup[date_key]["events"].append(_format_event_display(event))
-    return grouped
-
-
-def build_upcoming_preview_events(
-    events: List[Dict[str, object]], today: date, limit: int = 2
-) -> List[Dict[str, object]]:
-    preview_events: List[Dict[str, object]] = []
-    count = 0
-    for day in _group_future_events_by_date(events, today, max_days=None):
-        for event in day["events"]:
-            preview_events.append(event)
-            count += 1
-            if count >= limit:
-                return preview_events
-    return preview_events
-
-
-def build_upcoming_modal_days(
-    events: List[Dict[str, object]], today: date
-) -> List[Dict[str, object]]:
-    return _group_future_events_by_date(events, today, max_days=None)
-
-
 def _mini_calendar_category(type_value: str) -> str:
     lowered = type_value.lower()
     if "lecture" in lowered:
@@ -3285,41 +3539,38 @@ def _mini_calendar_category(type_value: str) -> str:
     return "other"
 
 
+def _month_event_info(event: ScheduleEvent) -> Dict[str, object]:
+    time_label = ""
+    start_time = event.start_time.strip()
+    end_time = event.end_time.strip()
+    if start_time and end_time:
+        time_label = f"{start_time}\u2013{end_time}"
+    elif start_time:
+        time_label = start_time
+    else:
+        time_label = event.time_display
+    return {
+        "title": event.title,
+        "course": event.course,
+        "course_short": event.course_short,
+        "type": event.type,
+        "type_badge_class": event.type_badge_class or "other",
+        "time": time_label,
+        "location": event.location or "",
+    }
+
+
 def build_month_events_map(
-    events: List[Dict[str, object]], year: int, month: int
+    schedule: ScheduleIndex, year: int, month: int
 ) -> Dict[str, List[Dict[str, object]]]:
     event_map: Dict[str, List[Dict[str, object]]] = {}
-    for event in events:
-        event_date = event.get("date")
-        if not isinstance(event_date, date):
-            continue
-        if event_date.year != year or event_date.month != month:
-            continue
-        iso_key = event_date.isoformat()
-        time_label = ""
-        start_time = str(event.get("start_time") or "").strip()
-        end_time = str(event.get("end_time") or "").strip()
-        if start_time and end_time:
-            time_label = f"{start_time}\u2013{end_time}"
-        elif start_time:
-            time_label = start_time
-        else:
-            time_label = str(event.get("time_display") or "")
-        event_info = {
-            "title": str(event.get("title") or ""),
-            "course": str(event.get("course") or ""),
-            "course_short": str(event.get("course_short") or ""),
-            "type": str(event.get("type") or ""),
-            "type_badge_class": str(event.get("type_badge_class") or "other"),
-            "time": time_label,
-            "location": str(event.get("location") or ""),
-        }
-        event_map.setdefault(iso_key, []).append(event_info)
+    for event in schedule.month(year, month):
+        event_map.setdefault(event.date_iso, []).append(_month_event_info(event))
     return event_map
 
 
 def build_mini_calendar_data(
-    events: List[Dict[str, object]],
+    schedule: ScheduleIndex,
     today: date,
     *,
     target_year: int | None = None,
@@ -3334,7 +3585,7 @@ def build_mini_calendar_data(
     first_day = date(year, month, 1)
     _, total_days = calendar.monthrange(year, month)
     weekday_labels = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-    event_map = build_month_events_map(events, year, month)
+    event_map = build_month_events_map(schedule, year, month)
     days: List[Dict[str, object]] = []
     leading_blanks = first_day.weekday()
     for _ in range(leading_blanks):
@@ -3373,20 +3624,256 @@ def build_mini_calendar_data(
     }
 
 
+def _cached_mini_calendar(
+    schedule: ScheduleIndex, today: date, year: int, month: int
+) -> Tuple[str, Tuple[Dict[str, object], bytes, bytes]]:
+    """Return (etag, (grid, json, gzipped json)) for a month, building it at most once."""
+    etag = hashlib.sha1(
+        f"{schedule.version}:{today.isoformat()}:{year:04d}-{month:02d}".encode("utf-8")
+    ).hexdigest()
+    entry = _mini_calendar_cache.get(etag)
+    if entry is None:
+        grid = build_mini_calendar_data(schedule, today, target_year=year, target_month=month)
+        body = json.dumps(grid, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        entry = (grid, body, gzip.compress(body))
+        _mini_calendar_cache.put(etag, entry)
+    return etag, entry
+
+
+def get_mini_calendar(schedule: ScheduleIndex, today: date, year: int, month: int) -> Dict[str, object]:
+    """Return the precomputed mini calendar grid for ``year``-``month``."""
+    return _cached_mini_calendar(schedule, today, year, month)[1][0]
+
+
+def build_schedule_view_model(
+    schedule: ScheduleIndex,
+    now: datetime,
+    *,
+    mini_year: int,
+    mini_month: int,
+    preview_limit: int = 2,
+    fallback_limit: int = 5,
+) -> Dict[str, object]:
+    """Build every schedule view the dashboard renders in a single pass.
+
+    Each event is visited once; upcoming events are formatted once and the
+    same display dict is shared by the preview strip and the upcoming modal.
+    The mini calendar grid comes from the shared month-grid cache.
+    """
+    today = now.date()
+    today_ordinal = today.toordinal()
+    week_end_ordinal = today_ordinal + 7
+
+    this_week: List[ScheduleEvent] = []
+    upcoming: List[ScheduleEvent] = []
+    calendar_events_data: List[Dict[str, str]] = []
+    full_grouped: List[Dict[str, object]] = []
+    week_grouped: List[Dict[str, object]] = []
+    fallback_grouped: List[Dict[str, object]] = []
+    focus_events: List[Dict[str, object]] = []
+    modal_days: List[Dict[str, object]] = []
+
+    current_date: date | None = None
+    heading = ""
+    modal_day: Dict[str, object] = {}
+    for event in schedule.events:
+        event_date = event.date
+        if event_date != current_date:
+            current_date = event_date
+            heading = event.date_heading
+            modal_day = {}
+        _append_to_date_group(full_grouped, heading, event)
+        if event_date.year == mini_year and event_date.month == mini_month:
+            calendar_events_data.append(_calendar_event_data(event))
+
+        ordinal = event_date.toordinal()
+        if ordinal < today_ordinal:
+            continue
+        if ordinal <= week_end_ordinal:
+            this_week.append(event)
+            _append_to_date_group(week_grouped, heading, event)
+        if len(upcoming) < fallback_limit:
+            _append_to_date_group(fallback_grouped, heading, event)
+        upcoming.append(event)
+
+        display = _format_event_display(event)
+        if len(focus_events) < preview_limit:
+            focus_events.append(display)
+        if not modal_day:
+            modal_day = {
+                "date": event_date,
+                "date_iso": event.date_iso,
+                "day_label": event_date.strftime("%d"),
+                "weekday": event_date.strftime("%a"),
+                "full_label": event_date.strftime("%A, %d %B %Y"),
+                "events": [],
+            }
+            modal_days.append(modal_day)
+        modal_day["events"].append(display)  # type: ignore[union-attr]
+
+    return {
+        "all_courses_schedule_sorted": schedule.events,
+        "all_courses_schedule_this_week": this_week,
+        "all_courses_schedule_upcoming": upcoming,
+        "all_courses_schedule_week_grouped": week_grouped,
+        "all_courses_schedule_fallback_grouped": fallback_grouped,
+        "all_courses_schedule_full_grouped": full_grouped,
+        "upcoming_events_focus": focus_events,
+        "upcoming_events_all": modal_days,
+        "upcoming_events_total": len(upcoming),
+        "calendar_events_data": calendar_events_data,
+        "mini_calendar": get_mini_calendar(schedule, today, mini_year, mini_month),
+    }
+
+
+_CacheValue = TypeVar("_CacheValue")
+
+
+class _LRUCache(Generic[_CacheValue]):
+    """Small thread-safe LRU used for rendered pages and serialized API payloads."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _CacheValue] = OrderedDict()
+        self._max_entries = max_entries
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, key: str) -> _CacheValue | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return value
+
+    def put(self, key: str, value: _CacheValue) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, "size": len(self._entries)}
+
+
+_page_cache: _LRUCache[str] = _LRUCache(PAGE_CACHE_SIZE)
+_schedule_json_cache: _LRUCache[Tuple[bytes, bytes]] = _LRUCache(SCHEDULE_JSON_CACHE_SIZE)
+_mini_calendar_cache: _LRUCache[Tuple[Dict[str, object], bytes, bytes]] = _LRUCache(
+    MINI_CALENDAR_CACHE_SIZE
+)
+_file_fingerprints: Dict[Path, Tuple[Tuple[int, int, int], str]] = {}
+_file_fingerprints_lock = threading.Lock()
+
+
+def _file_fingerprint(path: Path) -> str:
+    """Return the content hash of ``path``, re-hashing only when its stat changes."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return "missing"
+    stat_key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    with _file_fingerprints_lock:
+        cached = _file_fingerprints.get(path)
+        if cached is not None and cached[0] == stat_key:
+            return cached[1]
+    try:
+        digest = hashlib.sha1(path.read_bytes()).hexdigest()
+    except OSError:
+        return "missing"
+    with _file_fingerprints_lock:
+        _file_fingerprints[path] = (stat_key, digest)
+    return digest
+
+
+def _parse_mini_month(value: str, today: date) -> Tuple[int, int]:
+    target_year: int | None = None
+    target_month: int | None = None
+    match = re.fullmatch(r"(\d{4})-(\d{2})", value)
+    if match:
+        potential_year = int(match.group(1))
+        potential_month = int(match.group(2))
+        if 1 <= potential_month <= 12:
+            target_year = potential_year
+            target_month = potential_month
+    return target_year or today.year, target_month or today.month
+
+
+def _load_canvas_courses() -> List[Dict[str, str]]:
+    if not (CANVAS_BASE_URL and CANVAS_API_KEY):
+        return []
+    os.environ.setdefault("CANVAS_TOKEN", CANVAS_API_KEY)
+    try:
+        return get_active_courses_cached()
+    except RuntimeError as exc:
+        app.logger.error("Failed to fetch Canvas courses: %s", exc)
+        return []
+
+
 @app.route("/")
-def dashboard() -> str:
+def dashboard() -> Response:
+    """Serve the dashboard, reusing a rendered page while none of its inputs change.
+
+    The page only depends on the day, the mini-calendar month, tasks.json,
+    canvas_courses.json, the course schedule and the Canvas course list, so
+    those form the cache key and the ETag. No Last-Modified is sent: the
+    schedule and Canvas course list have no modification time, and a date
+    covering only the files would let stale pages revalidate.
+    """
+    now = datetime.now(TIMEZONE)
+    today = now.date()
+    mini_year, mini_month = _parse_mini_month(request.args.get("mini_month", ""), today)
+    canvas_courses = _load_canvas_courses()
+    tasks_hash = _file_fingerprint(TASKS_FILE)
+    courses_hash = _file_fingerprint(COURSES_FILE)
+    schedule = get_course_schedule()
+    cache_key = repr(
+        (
+            today.isoformat(),
+            mini_year,
+            mini_month,
+            tasks_hash,
+            courses_hash,
+            schedule.version,
+            [(course.get("name"), course.get("code")) for course in canvas_courses],
+        )
+    )
+    etag = hashlib.sha1(cache_key.encode("utf-8")).hexdigest()
+
+    page = _page_cache.get(etag)
+    if page is None:
+        page = _render_dashboard(now, schedule, canvas_courses, mini_year, mini_month)
+        _page_cache.put(etag, page)
+
+    response = make_response(page)
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+def _render_dashboard(
+    now: datetime,
+    schedule: ScheduleIndex,
+    canvas_courses: List[Dict[str, str]],
+    mini_year: int,
+    mini_month: int,
+) -> str:
     grouped = build_grouped_tasks()
+    task_cursors = {
+        group: encode_task_cursor(tasks, TASK_PAGE_SIZE)
+        for group, tasks in grouped.items()
+        if len(tasks) > TASK_PAGE_SIZE
+    }
     courses = load_courses()
-    if CANVAS_BASE_URL and CANVAS_API_KEY:
-        os.environ.setdefault("CANVAS_TOKEN", CANVAS_API_KEY)
-        try:
-            canvas_courses = get_active_courses()
-        except RuntimeError as exc:
-            app.logger.error("Failed to fetch Canvas courses: %s", exc)
-            canvas_courses = []
-    else:
-        canvas_courses = []
-    today = datetime.now(TIMEZONE).date()
+    today = now.date()
     upcoming_events: List[Dict[str, object]] = []
     for event in get_future_scientific_methods_events(today):
         event_copy = dict(event)
@@ -3416,61 +3903,118 @@ def dashboard() -> str:
         if not event_copy.get("submission"):
             event_copy["submission"] = ""
         upcoming_events.append(event_copy)
-    all_courses_schedule = _build_all_courses_schedule()
-    all_courses_schedule_sorted = get_sorted_schedule(all_courses_schedule)
-    study_schedule_this_week = get_schedule_this_week(
-        all_courses_schedule_sorted, today
-    )
-    study_schedule_upcoming = get_upcoming_schedule(
-        all_courses_schedule_sorted, today
-    )
-    upcoming_highlights = build_upcoming_highlights(all_courses_schedule_sorted, max_items=5)
-    upcoming_events_focus = build_upcoming_preview_events(study_schedule_upcoming, today, limit=2)
-    upcoming_events_all = build_upcoming_modal_days(study_schedule_upcoming, today)
-    upcoming_events_total = sum(len(day["events"]) for day in upcoming_events_all)
-    calendar_events_data = build_calendar_events_data(all_courses_schedule_sorted)
-    mini_month_param = request.args.get("mini_month", "")
-    target_year: int | None = None
-    target_month: int | None = None
-    match = re.fullmatch(r"(\d{4})-(\d{2})", mini_month_param)
-    if match:
-        potential_year = int(match.group(1))
-        potential_month = int(match.group(2))
-        if 1 <= potential_month <= 12:
-            target_year = potential_year
-            target_month = potential_month
-    mini_calendar = build_mini_calendar_data(
-        all_courses_schedule_sorted, today, target_year=target_year, target_month=target_month
+    schedule_view = build_schedule_view_model(
+        schedule, now, mini_year=mini_year, mini_month=mini_month
     )
-    week_grouped = group_schedule_by_date(study_schedule_this_week)
-    fallback_events = study_schedule_upcoming[:5]
-    fallback_grouped = group_schedule_by_date(fallback_events)
-    full_grouped = group_schedule_by_date(all_courses_schedule_sorted)
     week_range = {
         "start": today.strftime("%d %b"),
         "end": (today + timedelta(days=7)).strftime("%d %b %Y"),
     }
-    return render_template_string(
-        HTML_TEMPLATE,
+    return render_template(
+        DASHBOARD_TEMPLATE,
         grouped=grouped,
+        task_page_size=TASK_PAGE_SIZE,
+        task_cursors=task_cursors,
         sections=SECTION_CONFIG,
         courses=courses,
         canvas_courses=canvas_courses,
         scientific_methods_events=upcoming_events,
-        all_courses_schedule_sorted=all_courses_schedule_sorted,
-        all_courses_schedule_this_week=study_schedule_this_week,
-        all_courses_schedule_upcoming=study_schedule_upcoming,
         study_schedule_week_range=week_range,
-        all_courses_schedule_week_grouped=week_grouped,
-        all_courses_schedule_fallback_grouped=fallback_grouped,
-        all_courses_schedule_full_grouped=full_grouped,
-        upcoming_highlights=upcoming_highlights,
-        upcoming_events_focus=upcoming_events_focus,
-        upcoming_events_all=upcoming_events_all,
-        upcoming_events_total=upcoming_events_total,
-        calendar_events_data=calendar_events_data,
-        mini_calendar=mini_calendar,
         today_iso=today.isoformat(),
+        **schedule_view,
+    )
+
+
+def _json_response(etag: str, body: bytes, gzipped: bytes, *, max_age: int) -> Response:
+    """Build a cacheable JSON response, serving the gzip variant when accepted."""
+    use_gzip = request.accept_encodings.quality("gzip") > 0
+    response = Response(gzipped if use_gzip else body, mimetype="application/json")
+    if use_gzip:
+        response.headers["Content-Encoding"] = "gzip"
+        etag = f"{etag}-gz"
+    response.vary.add("Accept-Encoding")
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    return response.make_conditional(request)
+
+
+@app.route("/api/schedule")
+def schedule_api() -> tuple[object, int] | Response:
+    """Return calendar events dated between ``start`` and ``end`` (inclusive)."""
+    start = _parse_date_string(request.args.get("start"))
+    end = _parse_date_string(request.args.get("end"))
+    if start is None or end is None:
+        return jsonify({"error": "start and end must be dates in YYYY-MM-DD format."}), 400
+    if end < start or (end - start).days > SCHEDULE_API_MAX_DAYS:
+        return jsonify({"error": f"The range must span 0 to {SCHEDULE_API_MAX_DAYS} days."}), 400
+
+    schedule = get_course_schedule()
+    etag = hashlib.sha1(f"{schedule.version}:{start}:{end}".encode("utf-8")).hexdigest()
+    payload = _schedule_json_cache.get(etag)
+    if payload is None:
+        events = build_calendar_events_data(schedule.between(start, end))
+        body = json.dumps(
+            {"start": start.isoformat(), "end": end.isoformat(), "events": events},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        payload = (body, gzip.compress(body))
+        _schedule_json_cache.put(etag, payload)
+    return _json_response(etag, *payload, max_age=300)
+
+
+@app.route("/api/mini-calendar/<month_value>")
+def mini_calendar_api(month_value: str) -> tuple[object, int] | Response:
+    """Return the precomputed mini calendar grid for a ``YYYY-MM`` month."""
+    match = re.fullmatch(r"(\d{4})-(\d{2})", month_value)
+    if not match or not 1 <= int(match.group(2)) <= 12 or int(match.group(1)) < 1:
+        return jsonify({"error": "Month must be given as YYYY-MM."}), 400
+    today = datetime.now(TIMEZONE).date()
+    etag, (_, body, gzipped) = _cached_mini_calendar(
+        get_course_schedule(), today, int(match.group(1)), int(match.group(2))
+    )
+    return _json_response(etag, body, gzipped, max_age=60)
+
+
+@app.route("/api/tasks")
+def tasks_api() -> tuple[object, int] | object:
+    """Page through tasks in due order, optionally filtered by group and course.
+
+    ``group`` is TODAY, THIS WEEK or LATER (all tasks when omitted), ``course``
+    an exact course name, ``cursor`` the ``next_cursor`` of the previous page.
+    """
+    grouped = build_grouped_tasks()
+    group_param = request.args.get("group", "").strip().upper().replace("_", " ").replace("-", " ")
+    if group_param:
+        if group_param not in grouped:
+            return jsonify({"error": f"Unknown group: {group_param}"}), 400
+        tasks: Sequence[Dict[str, object]] = grouped[group_param]
+    else:
+        tasks = list(heapq.merge(*grouped.values(), key=_task_due))
+    course = request.args.get("course", "").strip()
+    if course:
+        tasks = [task for task in tasks if task["course"] == course]
+
+    try:
+        limit = int(request.args.get("limit", TASK_PAGE_SIZE))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer."}), 400
+    limit = max(1, min(limit, TASKS_API_MAX_LIMIT))
+    cursor = request.args.get("cursor", "")
+    try:
+        start = _decode_task_cursor(tasks, cursor) if cursor else 0
+    except ValueError:
+        return jsonify({"error": "Invalid cursor."}), 400
+
+    end = min(start + limit, len(tasks))
+    return jsonify(
+        {
+            "tasks": [_serialize_task(task) for task in tasks[start:end]],
+            "next_cursor": encode_task_cursor(tasks, end) if end < len(tasks) else None,
+            "remaining": len(tasks) - end,
+            "total": len(tasks),
+        }
     )
 
 
@@ -3549,6 +4093,19 @@ def travel_api() -> tuple[object, int] | object:
     return jsonify({"trips": simplified_trips})
 
 
+@app.route("/api/cache-stats")
+def cache_stats_api() -> object:
+    return jsonify(
+        {
+            "canvas_courses": course_cache_stats(),
+            "canvas_connections": pool_stats(),
+            "dashboard_pages": _page_cache.stats(),
+            "schedule_json": _schedule_json_cache.stats(),
+            "mini_calendar": _mini_calendar_cache.stats(),
+        }
+    )
+
+
 @app.route("/chat", methods=["POST"])
 def chat() -> tuple[dict[str, str], int] | tuple[dict[str, str], int, dict[str, str]]:
     data = request.get_json()